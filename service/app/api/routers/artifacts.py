@@ -3,6 +3,7 @@ import logging
 from pathlib import Path
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from sqlalchemy import select
@@ -13,7 +14,7 @@ from app.core.exceptions import NotFoundError, ForbiddenError, ValidationError,
 from app.db.session import get_db
 from app.models.session import RoundtableSession
 from app.models.share_token import ShareToken
-from app.services.artifacts.s3_upload import read_json_from_s3, read_pdf_from_s3, LOCAL_ARTIFACTS_PATH
+from app.services.artifacts.s3_upload import read_json_from_s3, stream_artifact_from_s3, LOCAL_ARTIFACTS_PATH
 from fastapi import Header
 from datetime import datetime, timezone
 from typing import Optional, List
@@ -347,12 +348,11 @@ async def download_artifact(
     if not artifact_uri:
         raise NotFoundError(resource="Artifact", identifier=session_id)
     
-    # Check if it's an S3 or file:// URI (read_json_from_s3 handles both)
+    # Check if it's an S3 or file:// URI (stream_artifact_from_s3 handles both)
     if artifact_uri.startswith("s3://") or artifact_uri.startswith("file://"):
         try:
-            json_bytes = read_json_from_s3(artifact_uri)
             return StreamingResponse(
-                iter([json_bytes]),
+                stream_artifact_from_s3(artifact_uri),
                 media_type="application/json",
                 headers={
                     "Content-Disposition": f'attachment; filename="{session_id}_debate_output.json"'
@@ -478,12 +478,11 @@ async def download_pdf(
     if not pdf_uri:
         raise NotFoundError(resource="PDF artifact", identifier=session_id)
     
-    # Check if it's an S3 or file:// URI (read_pdf_from_s3 handles both)
+    # Check if it's an S3 or file:// URI (stream_artifact_from_s3 handles both)
     if pdf_uri.startswith("s3://") or pdf_uri.startswith("file://"):
         try:
-            pdf_bytes = read_pdf_from_s3(pdf_uri)
             return StreamingResponse(
-                iter([pdf_bytes]),
+                stream_artifact_from_s3(pdf_uri),
                 media_type="application/pdf",
                 headers={
                     "Content-Disposition": f'attachment; filename="{session_id}_executive_brief.pdf"'
@@ -568,8 +567,7 @@ async def download_pdf_from_json(
         if artifact_uri.startswith("s3://") or artifact_uri.startswith("file://"):
             try:
                 json_bytes = read_json_from_s3(artifact_uri)
-                import json
-                session_json = json.loads(json_bytes.decode("utf-8"))
+                session_json = orjson.loads(json_bytes)
             except FileNotFoundError:
                 # If file:// URI failed, try migrating from /tmp/artifacts/ to /data/artifacts/
                 if artifact_uri.startswith("file:///tmp/artifacts/"):
@@ -578,8 +576,7 @@ async def download_pdf_from_json(
                     logger.info(f"[download-pdf-from-json] File not found at original path, trying migrated path: {migrated_path}")
                     if Path(migrated_path).exists():
                         json_bytes = read_json_from_s3(f"file://{migrated_path}")
-                        import json
-                        session_json = json.loads(json_bytes.decode("utf-8"))
+                        session_json = orjson.loads(json_bytes)
                     else:
                         # Try to find by session ID pattern
                         data_artifacts_dir = Path("/data/artifacts")
@@ -588,8 +585,7 @@ async def download_pdf_from_json(
                             if session_files:
                                 logger.info(f"[download-pdf-from-json] Found session JSON file: {session_files[0]}")
                                 json_bytes = read_json_from_s3(f"file://{session_files[0]}")
-                                import json
-                                session_json = json.loads(json_bytes.decode("utf-8"))
+                                session_json = orjson.loads(json_bytes)
                             else:
                                 raise NotFoundError(resource="JSON file", identifier=artifact_uri)
                         else:
@@ -623,9 +619,7 @@ async def download_pdf_from_json(
                 else:
                     raise NotFoundError(resource="JSON file", identifier=artifact_uri)
             
-            import json
-            with open(json_path, "r", encoding="utf-8") as f:
-                session_json = json.load(f)
+            session_json = orjson.loads(json_path.read_bytes())
         
         # Generate PDF from JSON
         from app.services.artifacts.debate_pdf_generator import generate_pdf_from_debate_json
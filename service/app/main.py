@@ -10,6 +10,7 @@
 from contextlib import asynccontextmanager
 import asyncio
 import logging
+import platform
 import re
 from urllib.parse import urlparse
 
@@ -95,6 +96,16 @@ async def lifespan(app: FastAPI):  # type: ignore[override]
         logger.error(f"[startup] Error during debate recovery: {e}", exc_info=True)
         # Don't fail startup if recovery fails - app should still start
     
+    # Startup: Pre-warm the shared Chromium so the first PDF doesn't pay the launch cost
+    # (Windows renders PDFs with sync Playwright in a thread, so there is nothing to warm)
+    if platform.system() != "Windows":
+        try:
+            from app.services.artifacts import browser_pool
+            await browser_pool.warm_up()
+            logger.info("[startup] ✅ Chromium browser pre-warmed for PDF generation")
+        except Exception as e:
+            logger.warning(f"[startup] ⚠️ Could not pre-warm Chromium (PDFs will launch it on demand): {e}")
+    
     # Start background cleanup task for memory management
     cleanup_task = None
     pool_monitor_task = None
@@ -164,6 +175,9 @@ async def lifespan(app: FastAPI):  # type: ignore[override]
                     logger.debug(f"[shutdown] Error waiting for pool monitor task: {e}")
                 else:
                     logger.info("[shutdown] Stopped connection pool monitoring task")
+            if platform.system() != "Windows":
+                from app.services.artifacts import browser_pool
+                await browser_pool.close_browser()
             logger.info("[shutdown] Application shutting down gracefully")
         except (asyncio.CancelledError, KeyboardInterrupt):
             # Expected during shutdown - suppress these errors
@@ -0,0 +1,201 @@
+"""
+Shared headless Chromium for PDF rendering.
+
+Launching Chromium costs hundreds of milliseconds, so each process keeps one browser
+alive and reuses it for every render. The API warms it up at startup so the first
+PDF does not pay the launch cost.
+
+The browser is bound to the event loop it was launched on. Celery tasks run each
+job on a fresh loop, so the task runner closes the browser (close_browser) before its
+loop closes and the next job relaunches it.
+Each render gets its own BrowserContext (get_context) so jobs never share cookies,
+storage or cache; callers close the context, never the browser. Renders hold a
+render_slot() while Chromium lays out and prints, so a burst of PDFs queues instead
+of opening unbounded pages on the shared browser.
+
+Windows can't launch Playwright from the event loop, so run_sync renders on a small
+thread pool where every worker thread keeps its own sync Playwright browser.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright
+    from playwright.sync_api import Browser as SyncBrowser
+    from playwright.sync_api import BrowserContext as SyncBrowserContext
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Chromium flags shared by every PDF renderer
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-accelerated-2d-canvas",
+    "--no-first-run",
+    "--no-zygote",
+    "--disable-gpu",
+]
+
+# Extra flags for the Windows sync browsers: skip translate UI setup and finish compositing
+# before capture. --single-process is deliberately not used: it is unsupported upstream
+# and crashes when a browser hosts several contexts, which run_sync relies on.
+SYNC_CHROMIUM_ARGS = CHROMIUM_ARGS + [
+    "--disable-features=TranslateUI",
+    "--run-all-compositor-stages-before-draw",
+]
+
+# Resolves once web fonts have loaded; evaluated after set_content so a brief that
+# pulls in fonts is never printed with fallback glyphs. No-op for inline-only HTML.
+FONTS_READY_SCRIPT = "() => document.fonts.ready.then(() => undefined)"
+
+_playwright: Optional["Playwright"] = None
+_browser: Optional["Browser"] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock: Optional[asyncio.Lock] = None
+_render_semaphore: Optional[asyncio.Semaphore] = None
+
+# Pages the shared browser lays out / prints at once; LLM work is not throttled by this
+MAX_CONCURRENT_RENDERS = int(os.getenv("PDF_MAX_CONCURRENCY", "4"))
+
+# Windows sync path: worker threads, each with its own Playwright + browser
+SYNC_BROWSER_WORKERS = int(os.getenv("PDF_SYNC_BROWSER_WORKERS", "2"))
+
+_sync_local = threading.local()
+_sync_executor: Optional[ThreadPoolExecutor] = None
+_sync_executor_lock = threading.Lock()
+
+
+def _reset_for_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Forget state created on another event loop (it cannot be reused here)."""
+    global _playwright, _browser, _loop, _lock, _render_semaphore
+    if _browser is not None and _browser.is_connected():
+        logger.warning(
+            "[browser_pool] Dropping a browser launched on a previous event loop without closing it; "
+            "call close_browser() before that loop closes"
+        )
+    _playwright = None
+    _browser = None
+    _loop = loop
+    _lock = asyncio.Lock()
+    _render_semaphore = asyncio.Semaphore(MAX_CONCURRENT_RENDERS)
+
+
+async def get_browser() -> "Browser":
+    """Return the shared Chromium browser, launching it on first use."""
+    global _playwright, _browser
+
+    loop = asyncio.get_running_loop()
+    if _loop is not loop:
+        _reset_for_loop(loop)
+
+    if _browser is not None and _browser.is_connected():
+        return _browser
+
+    assert _lock is not None
+    async with _lock:
+        if _browser is not None and _browser.is_connected():
+            return _browser
+
+        # Imported lazily so processes that never render PDFs skip Playwright entirely
+        from playwright.async_api import async_playwright
+
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+        logger.info("[browser_pool] Launching shared Chromium browser")
+        _browser = await _playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        return _browser
+
+
+def render_slot() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent renders on this loop's browser (use with async with)."""
+    loop = asyncio.get_running_loop()
+    if _loop is not loop:
+        _reset_for_loop(loop)
+    assert _render_semaphore is not None
+    return _render_semaphore
+
+
+async def get_context() -> "BrowserContext":
+    """Return a fresh context on the shared browser; the caller must close it."""
+    browser = await get_browser()
+    return await browser.new_context()
+
+
+async def warm_up() -> None:
+    """Launch the shared browser and load a blank page so the first PDF is warm."""
+    browser = await get_browser()
+    page = await browser.new_page()
+    try:
+        await page.goto("about:blank")
+    finally:
+        await page.close()
+
+
+async def close_browser() -> None:
+    """Close the shared browser and stop Playwright (called on shutdown)."""
+    global _playwright, _browser
+
+    if _loop is not asyncio.get_running_loop():
+        return
+
+    try:
+        if _browser is not None:
+            await _browser.close()
+        if _playwright is not None:
+            await _playwright.stop()
+    finally:
+        _browser = None
+        _playwright = None
+
+
+def _get_thread_browser() -> "SyncBrowser":
+    """Return this worker thread's sync browser, launching it on first use."""
+    browser = getattr(_sync_local, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    from playwright.sync_api import sync_playwright
+
+    if getattr(_sync_local, "playwright", None) is None:
+        _sync_local.playwright = sync_playwright().start()
+    logger.info(f"[browser_pool] Launching Chromium for thread {threading.current_thread().name}")
+    _sync_local.browser = _sync_local.playwright.chromium.launch(headless=True, args=SYNC_CHROMIUM_ARGS)
+    return _sync_local.browser
+
+
+def _run_with_thread_context(fn: Callable[["SyncBrowserContext"], T]) -> T:
+    context = _get_thread_browser().new_context()
+    try:
+        return fn(context)
+    finally:
+        context.close()
+
+
+def _get_sync_executor() -> ThreadPoolExecutor:
+    global _sync_executor
+    with _sync_executor_lock:
+        if _sync_executor is None:
+            _sync_executor = ThreadPoolExecutor(
+                max_workers=SYNC_BROWSER_WORKERS, thread_name_prefix="pdf-browser"
+            )
+        return _sync_executor
+
+
+async def run_sync(fn: Callable[["SyncBrowserContext"], T]) -> T:
+    """
+    Run fn(context) on a browser worker thread with a fresh sync BrowserContext.
+
+    Used on Windows, where async Playwright can't spawn Chromium. Worker threads keep
+    their browsers for the life of the process.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_sync_executor(), _run_with_thread_context, fn)
@@ -4,10 +4,15 @@ Generates PDFs from session JSON using direct extraction (no LLM).
 Extracted from trial/json_to_document.py - completely self-contained.
 """
 import asyncio
+import hashlib
 import logging
+import os
 import platform
+import tempfile
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 try:
     import markdown
@@ -15,8 +20,36 @@ try:
 except ImportError:
     MARKDOWN_AVAILABLE = False
 
+from app.services.artifacts import browser_pool
+
 logger = logging.getLogger(__name__)
 
+# Static page.pdf() options, built once instead of per render (footer is added per call)
+_PDF_OPTIONS: Dict[str, Any] = {
+    "format": "A4",
+    "margin": {
+        "top": "0.5in",
+        "right": "0.5in",
+        "bottom": "0.8in",  # Extra for footer
+        "left": "0.5in",
+    },
+    "print_background": True,
+    "display_header_footer": True,
+    "header_template": "<div></div>",  # Empty header
+}
+
+_PDF_FOOTER_TEMPLATE = """
+    <div style="font-size: 10px; color: #888; width: 100%; display: flex; justify-content: space-between; align-items: center; padding: 0 20mm; border-top: 1px solid #e2e8f0; padding-top: 8px;">
+        <span style="flex: 1; text-align: left;">{date}</span>
+        <span style="flex: 1; text-align: right;">Page <span class="pageNumber"></span></span>
+    </div>
+"""
+
+# Rendered PDFs keyed by a hash of their Markdown + footer date, so re-downloading an
+# unchanged session skips HTML conversion and Chromium entirely. Oldest entries are evicted past the limit.
+PDF_CACHE_DIR = Path(os.getenv("PDF_CACHE_DIR", "/tmp/artifacts/pdf_cache"))
+PDF_CACHE_MAX_ENTRIES = int(os.getenv("PDF_CACHE_MAX_ENTRIES", "64"))
+
 
 # ============================================================================
 # Data Extraction Functions
@@ -162,17 +195,25 @@ def extract_json_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Extract key information from JSON according to specified structure."""
     events = data.get("events", [])
     
+    # Index events by type once so each extractor only walks its own events
+    events_by_type: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    for event in events:
+        events_by_type[event.get("event_type")].append(event)
+    
+    def of_type(event_type: str) -> List[Dict[str, Any]]:
+        return events_by_type.get(event_type, [])
+    
     return {
         "session_metadata": extract_session_metadata(data.get("session_metadata", {})),
-        "session_initialization": extract_session_initialization(events),
-        "research": extract_research_events(events),
-        "opening": extract_opening_events(events),
-        "cross_examination": extract_cross_examination_events(events),
-        "red_team": extract_red_team_events(events),
-        "rebuttals": extract_rebuttal_events(events),
-        "convergence": extract_convergence_events(events),
-        "translator": extract_translator_events(events),
-        "closed": extract_closed_events(events)
+        "session_initialization": extract_session_initialization(of_type("session_initialization")),
+        "research": extract_research_events(of_type("research_result")),
+        "opening": extract_opening_events(of_type("position_card")),
+        "cross_examination": extract_cross_examination_events(of_type("challenge")),
+        "red_team": extract_red_team_events(of_type("red_team_critique")),
+        "rebuttals": extract_rebuttal_events(of_type("rebuttal")),
+        "convergence": extract_convergence_events(of_type("convergence")),
+        "translator": extract_translator_events(of_type("translator_output")),
+        "closed": extract_closed_events(of_type("moderator_ruling"))
     }
 
 
@@ -671,6 +712,62 @@ def markdown_to_html(markdown_content: str) -> str:
     return html
 
 
+# ============================================================================
+# PDF Cache
+# ============================================================================
+
+def _pdf_cache_key(markdown_content: str) -> str:
+    """
+    Hash the Markdown together with the date stamped in the header and footer.
+    
+    markdown_to_html() is deterministic, so the rendered HTML is a pure function
+    of these two inputs and a hit can skip the conversion as well as Chromium.
+    """
+    date = datetime.now().strftime("%Y.%m.%d")
+    return hashlib.blake2b(f"{date}\0{markdown_content}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read_cached_pdf(key: str) -> Optional[bytes]:
+    """Return cached PDF bytes for key, or None on a miss."""
+    cached_path = PDF_CACHE_DIR / f"brief_{key}.pdf"
+    try:
+        pdf_bytes = cached_path.read_bytes()
+    except OSError:
+        return None
+    # Bump mtime so eviction drops the least recently used entries first; a concurrent
+    # eviction may already have removed the file, but the bytes are in hand
+    try:
+        os.utime(cached_path)
+    except OSError:
+        pass
+    return pdf_bytes
+
+
+def _write_cached_pdf(key: str, pdf_bytes: bytes) -> None:
+    """Store PDF bytes under key and evict the oldest entries beyond the limit."""
+    try:
+        PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cached_path = PDF_CACHE_DIR / f"brief_{key}.pdf"
+        # Unique temp name so concurrent renders of the same key can't clobber each other
+        with tempfile.NamedTemporaryFile(
+            dir=PDF_CACHE_DIR, prefix=f"brief_{key}.", suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+        try:
+            tmp_path.write_bytes(pdf_bytes)
+            os.replace(tmp_path, cached_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        entries = sorted(PDF_CACHE_DIR.glob("brief_*.pdf"), key=lambda p: p.stat().st_mtime)
+        for stale_path in entries[:-PDF_CACHE_MAX_ENTRIES]:
+            stale_path.unlink(missing_ok=True)
+    except OSError as e:
+        # Caching is best-effort - never fail PDF generation because of it
+        logger.warning(f"[debate_pdf_generator] Could not write PDF cache entry: {e}")
+
+
 # ============================================================================
 # PDF Generation
 # ============================================================================
@@ -704,6 +801,13 @@ async def generate_pdf_from_debate_json(session_json: Dict[str, Any]) -> bytes:
         markdown_content = format_output_markdown(extracted_data)
         logger.info(f"[debate_pdf_generator] Markdown generated, length: {len(markdown_content)} chars")
         
+        # Identical Markdown on the same day renders an identical PDF - skip Steps 3-4 on a hit
+        cache_key = _pdf_cache_key(markdown_content)
+        pdf_bytes = await asyncio.to_thread(_read_cached_pdf, cache_key)
+        if pdf_bytes is not None:
+            logger.info(f"[debate_pdf_generator] Using cached PDF {cache_key}, size: {len(pdf_bytes)} bytes")
+            return pdf_bytes
+        
         # Step 3: Convert Markdown to HTML
         logger.info("[debate_pdf_generator] Step 3: Converting Markdown to HTML...")
         html_content = markdown_to_html(markdown_content)
@@ -713,6 +817,7 @@ async def generate_pdf_from_debate_json(session_json: Dict[str, Any]) -> bytes:
         logger.info("[debate_pdf_generator] Step 4: Generating PDF with Playwright...")
         pdf_bytes = await html_to_pdf_bytes(html_content)
         logger.info(f"[debate_pdf_generator] PDF generated successfully, size: {len(pdf_bytes)} bytes")
+        await asyncio.to_thread(_write_cached_pdf, cache_key, pdf_bytes)
         
         return pdf_bytes
         
@@ -733,108 +838,50 @@ async def html_to_pdf_bytes(html_content: str) -> bytes:
     """
     if platform.system() == "Windows":
         # Windows fix: Use sync Playwright in a thread to avoid subprocess issues
-        def run_playwright_sync(html: str) -> bytes:
-            """Run Playwright synchronously in a thread to avoid Windows subprocess issues."""
-            from playwright.sync_api import sync_playwright
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-accelerated-2d-canvas",
-                        "--no-first-run",
-                        "--no-zygote",
-                        "--disable-gpu",
-                    ],
-                )
-                try:
-                    page = browser.new_page()
-                    page.set_content(html, wait_until="networkidle")
-
-                    # Format date for footer
-                    date = datetime.now().strftime("%Y.%m.%d")
-
-                    # Generate PDF with footer
-                    pdf_bytes = page.pdf(
-                        format="A4",
-                        margin={
-                            "top": "0.5in",
-                            "right": "0.5in",
-                            "bottom": "0.8in",
-                            "left": "0.5in",
-                        },
-                        print_background=True,
-                        display_header_footer=True,
-                        header_template="<div></div>",
-                        footer_template=f"""
-                            <div style="font-size: 10px; color: #888; width: 100%; display: flex; justify-content: space-between; align-items: center; padding: 0 20mm; border-top: 1px solid #e2e8f0; padding-top: 8px;">
-                                <span style="flex: 1; text-align: left;">{date}</span>
-                                <span style="flex: 1; text-align: right;">Page <span class="pageNumber"></span></span>
-                            </div>
-                        """,
-                    )
-                    return pdf_bytes
-                finally:
-                    browser.close()
-
-        # Run Playwright in a thread to avoid Windows subprocess issues
+        def render_pdf(context) -> bytes:
+            """Render on a pooled sync browser (avoids Windows subprocess issues)."""
+            page = context.new_page()
+            page.set_content(html_content, wait_until="load")
+            page.evaluate(browser_pool.FONTS_READY_SCRIPT)
+
+            # Format date for footer
+            date = datetime.now().strftime("%Y.%m.%d")
+
+            # Generate PDF with footer
+            return page.pdf(
+                **_PDF_OPTIONS,
+                footer_template=_PDF_FOOTER_TEMPLATE.format(date=date),
+            )
+
+        # Run Playwright on a browser worker thread to avoid Windows subprocess issues
         logger.info("[debate_pdf_generator] Running Playwright in thread (Windows workaround)")
         try:
-            pdf_bytes = await asyncio.to_thread(run_playwright_sync, html_content)
+            pdf_bytes = await browser_pool.run_sync(render_pdf)
             return pdf_bytes
         except Exception as e:
             logger.error(f"[debate_pdf_generator] Error generating PDF on Windows: {e}", exc_info=True)
             raise Exception(f"PDF generation failed: {e}") from e
     else:
-        # Non-Windows: Use async Playwright
-        from playwright.async_api import async_playwright
-
+        # Non-Windows: Use async Playwright on the shared, pre-warmed browser
         async def run_playwright_async(html: str) -> bytes:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--no-sandbox",
-                        "--disable-setuid-sandbox",
-                        "--disable-dev-shm-usage",
-                        "--disable-accelerated-2d-canvas",
-                        "--no-first-run",
-                        "--no-zygote",
-                        "--disable-gpu",
-                    ],
-                )
+            async with browser_pool.render_slot():
+                context = await browser_pool.get_context()
                 try:
-                    page = await browser.new_page()
-                    await page.set_content(html, wait_until="networkidle")
+                    page = await context.new_page()
+                    await page.set_content(html, wait_until="load")
+                    await page.evaluate(browser_pool.FONTS_READY_SCRIPT)
 
                     # Format date for footer
                     date = datetime.now().strftime("%Y.%m.%d")
 
                     # Generate PDF with footer
                     pdf_bytes = await page.pdf(
-                        format="A4",
-                        margin={
-                            "top": "0.5in",
-                            "right": "0.5in",
-                            "bottom": "0.8in",
-                            "left": "0.5in",
-                        },
-                        print_background=True,
-                        display_header_footer=True,
-                        header_template="<div></div>",
-                        footer_template=f"""
-                            <div style="font-size: 10px; color: #888; width: 100%; display: flex; justify-content: space-between; align-items: center; padding: 0 20mm; border-top: 1px solid #e2e8f0; padding-top: 8px;">
-                                <span style="flex: 1; text-align: left;">{date}</span>
-                                <span style="flex: 1; text-align: right;">Page <span class="pageNumber"></span></span>
-                            </div>
-                        """,
+                        **_PDF_OPTIONS,
+                        footer_template=_PDF_FOOTER_TEMPLATE.format(date=date),
                     )
                     return pdf_bytes
                 finally:
-                    await browser.close()
+                    await context.close()
 
         try:
             pdf_bytes = await run_playwright_async(html_content)
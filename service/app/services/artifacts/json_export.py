@@ -1,18 +1,67 @@
 """JSON export utility for debate sessions."""
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
+import orjson
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.session import RoundtableSession
 from app.models.session_event import SessionEvent
 
+# Rows fetched per round-trip when streaming events from the database
+EVENT_BATCH_SIZE = 500
+
+
+def _orjson_default(obj: Any) -> str:
+    """
+    Serialize UUID subclasses, which orjson rejects.
+
+    asyncpg returns PGUUID(as_uuid=True) columns as asyncpg.pgproto.pgproto.UUID; orjson
+    only formats exact uuid.UUID instances natively.
+    """
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _event_to_dict(event: SessionEvent) -> dict[str, Any]:
+    """Convert a SessionEvent row into its exported JSON shape (for orjson serialization)."""
+    event_data: dict[str, Any] = {
+        # UUID and datetime values are left for orjson (UUID subclasses go through _orjson_default)
+        "id": event.id,
+        "sequence_id": event.sequence_id,
+        "phase": event.phase,
+        "event_type": event.event_type,
+        "schema_version": event.schema_version,
+        "payload": event.payload if isinstance(event.payload, dict) else {},
+        "created_at": event.created_at,
+    }
+    
+    # Add optional fields
+    if event.knight_id:
+        event_data["knight_id"] = event.knight_id
+    if event.prompt_tokens is not None:
+        event_data["prompt_tokens"] = event.prompt_tokens
+    if event.completion_tokens is not None:
+        event_data["completion_tokens"] = event.completion_tokens
+    if event.cost_cents is not None:
+        event_data["cost_cents"] = event.cost_cents
+    if event.latency_ms is not None:
+        event_data["latency_ms"] = event.latency_ms
+    
+    return event_data
+
+
+def _encode_chunk(event_dicts: list[dict[str, Any]]) -> bytes:
+    """Serialize a batch of exported event dicts into comma-separated JSON objects (runs in a worker thread)."""
+    return b",".join(orjson.dumps(event_data, default=_orjson_default) for event_data in event_dicts)
+
 
 async def export_debate_to_json(
     session_id: str | UUID, session: RoundtableSession, db: AsyncSession, output_dir: Path | None = None
@@ -44,67 +93,74 @@ async def export_debate_to_json(
     if hasattr(session, "session_id") and session.session_id:
         session_id_str = str(session.session_id)
     
-    # Fetch all events for this session
-    stmt = select(SessionEvent).where(SessionEvent.session_id == session.id).order_by(SessionEvent.sequence_id)
-    result = await db.execute(stmt)
-    events = result.scalars().all()
-    
-    # Build JSON structure
-    json_data: dict[str, Any] = {
-        "session_metadata": {
-            "session_id": session_id_str,
-            "session_db_id": str(session.id),
-            "topic": session.topic,
-            "status": session.status,
-            "created_at": session.created_at.isoformat() if session.created_at else None,
-            "completed_at": session.completed_at.isoformat() if session.completed_at else None,
-            "exported_at": datetime.now().isoformat(),
-        },
-        "events": [],
+    # Build session metadata
+    session_metadata: dict[str, Any] = {
+        "session_id": session_id_str,
+        "session_db_id": session.id,
+        "topic": session.topic,
+        "status": session.status,
+        "created_at": session.created_at.isoformat() if session.created_at else None,
+        "completed_at": session.completed_at.isoformat() if session.completed_at else None,
+        "exported_at": datetime.now().isoformat(),
     }
     
     # Add participants if available
     if session.knights:
-        json_data["session_metadata"]["participants"] = [
+        session_metadata["participants"] = [
             {
-                "knight_id": str(knight.knight_id) if knight.knight_id else None,
-                "session_knight_id": str(knight.id),
+                "knight_id": knight.knight_id or None,
+                "session_knight_id": knight.id,
             }
             for knight in session.knights
         ]
     
-    # Serialize events
-    for event in events:
-        event_data: dict[str, Any] = {
-            "id": str(event.id),
-            "sequence_id": event.sequence_id,
-            "phase": event.phase,
-            "event_type": event.event_type,
-            "schema_version": event.schema_version,
-            "payload": event.payload if isinstance(event.payload, dict) else {},
-            "created_at": event.created_at.isoformat() if event.created_at else None,
-        }
-        
-        # Add optional fields
-        if event.knight_id:
-            event_data["knight_id"] = str(event.knight_id)
-        if event.prompt_tokens is not None:
-            event_data["prompt_tokens"] = event.prompt_tokens
-        if event.completion_tokens is not None:
-            event_data["completion_tokens"] = event.completion_tokens
-        if event.cost_cents is not None:
-            event_data["cost_cents"] = event.cost_cents
-        if event.latency_ms is not None:
-            event_data["latency_ms"] = event.latency_ms
-        
-        json_data["events"].append(event_data)
+    # The "events" array is appended incrementally below
+    json_prefix = b'{"session_metadata":' + orjson.dumps(session_metadata, default=_orjson_default) + b',"events":['
+    
+    # Stream events from a server-side cursor and write them as they arrive,
+    # so only a couple of batches of rows are held in memory at a time
+    stmt = (
+        select(SessionEvent)
+        .where(SessionEvent.session_id == session.id)
+        .order_by(SessionEvent.sequence_id)
+        .execution_options(yield_per=EVENT_BATCH_SIZE)
+    )
     
-    # Save to file
     filename = f"{session_id_str}_debate_output.json"
     json_path = output_dir / filename
     
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False)
+    pending: asyncio.Task[bytes] | None = None
+    encoding: asyncio.Task[bytes] | None = None
+    f = None
+    result = await db.stream_scalars(stmt)
+    try:
+        f = await asyncio.to_thread(json_path.open, "wb")
+        await asyncio.to_thread(f.write, json_prefix)
+        # Serialize each batch in a worker thread while the next one is fetched. The dicts
+        # are built here: ORM instances and the AsyncSession must stay on the event loop
+        # thread (an expired attribute would lazy-load off the loop and fail)
+        separator = b""
+        async for partition in result.partitions():
+            event_dicts = [_event_to_dict(event) for event in partition]
+            encoding = asyncio.create_task(asyncio.to_thread(_encode_chunk, event_dicts))
+            if pending is not None:
+                await asyncio.to_thread(f.write, separator + await pending)
+                separator = b","
+            pending, encoding = encoding, None
+        if pending is not None:
+            await asyncio.to_thread(f.write, separator + await pending)
+        await asyncio.to_thread(f.write, b"]}")
+    finally:
+        # On failure, don't leave encodes running unobserved or the server-side cursor open
+        for task in (pending, encoding):
+            if task is None:
+                continue
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # mark any error retrieved; the one being raised is already logged
+        await result.close()
+        if f is not None:
+            await asyncio.to_thread(f.close)
     
     return str(json_path)
-
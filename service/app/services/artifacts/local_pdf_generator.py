@@ -6,30 +6,82 @@ Uses TWO-STAGE LLM pipeline (same as frontend):
   Stage 2: Render structured JSON to HTML (anthropic/claude-haiku-4.5)
 """
 import asyncio
-import json
+import copy
+import hashlib
 import logging
 import os
 import platform
+import random
 import re
-import sys
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from playwright.async_api import async_playwright
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.redis import get_redis_client
+from app.services.artifacts import browser_pool
+from app.services.artifacts.templates import get_fallback_brief_template
 from app.services.llm.router import LLMRouter, LLMRequest
 
 logger = logging.getLogger(__name__)
 
-T = TypeVar('T')
+# Static page.pdf() options, built once instead of per render (footer is added per call)
+# Page size and margins come from the @page rules (brief.css, or the LLM's own <style>);
+# brief.css keeps a taller bottom margin for the footer
+_PDF_OPTIONS: Dict[str, Any] = {
+    "prefer_css_page_size": True,
+    "print_background": True,
+    "display_header_footer": True,
+    "header_template": "<div></div>",  # Empty header
+}
+
+_PDF_FOOTER_TEMPLATE = """
+    <div style="font-size: 10px; color: #888; width: 100%; display: flex; justify-content: space-between; align-items: center; padding: 0 20mm; border-top: 1px solid #e2e8f0; padding-top: 8px;">
+        <span style="flex: 1; text-align: left;">{date}</span>
+        <span style="flex: 1; text-align: right;">Page <span class="pageNumber"></span></span>
+    </div>
+"""
+
+# Base CSS for Stage 2 briefs, added to every page before printing (see brief.css)
+BRIEF_CSS_PATH = Path(__file__).with_name("brief.css")
+
+# Unpadded month/day for the Stage 2 brief date; the strftime flag differs on Windows
+_DATE_FMT = "%Y.%-m.%-d" if os.name != "nt" else "%Y.%#m.%#d"
 
 
 # =============================================================================
 # VALIDATION (matches frontend/lib/pdf/validation.ts)
 # =============================================================================
 
+# <body>/<html> open and close tags for validate_html_structure, compiled once per process.
+# Group index identifies the tag: 1 = <body>, 2 = </body>, 3 = <html>, 4 = </html>
+# Matched against the already-lowercased HTML, so no IGNORECASE folding per character.
+_STRUCTURE_TAG_RE = re.compile(r'(<body[^>]*>)|(</body>)|(<html[^>]*>)|(</html>)')
+
+
+# Shared across PDF generations so router setup and provider health tracking are reused
+_router: Optional[LLMRouter] = None
+
+
+def _get_router() -> LLMRouter:
+    """Return the module-level LLMRouter, creating it on first use."""
+    global _router
+    if _router is None:
+        _router = LLMRouter()
+    return _router
+
+
+# Strip optional markdown code fences (and surrounding whitespace) from LLM output in one scan
+_JSON_FENCE_RE = re.compile(r'^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL)
+_HTML_FENCE_RE = re.compile(r'^\s*(?:```(?:html)?)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL)
+# Content of the first <body>, up to </body> or, if the closing tag is missing, the end
+_BODY_CONTENT_RE = re.compile(r'<body[^>]*>(.*?)(?:</body>|\Z)', re.DOTALL | re.IGNORECASE)
+
+
 @dataclass
 class JsonValidationResult:
     valid: bool
@@ -47,6 +99,55 @@ class HtmlValidationResult:
 class RetryConfig:
     max_retries: int = 2
     retry_delay_ms: int = 1000
+    max_delay_ms: int = 30_000
+    # Upper bound on a single attempt so a hung provider call is retried instead of
+    # stalling the pipeline; None disables the limit
+    per_attempt_timeout_s: Optional[float] = 60
+
+
+# Schema for validate_structured_brief (mirrors the Stage 1 prompt's output format)
+_BRIEF_REQUIRED_FIELDS = (
+    "recommendation",
+    "executive_summary",
+    "rationale",
+    "critical_risks",
+    "immediate_actions",
+)
+
+# (field, min items, max items, noun used in error messages)
+_BRIEF_ARRAY_RULES = (
+    ("rationale", 2, 5, "rationale points"),
+    ("critical_risks", 3, 10, "risks"),
+    ("immediate_actions", 3, 10, "actions"),
+)
+
+# (field, min stripped length)
+_BRIEF_STRING_RULES = (
+    ("executive_summary", 50),
+    ("recommendation", 20),
+)
+
+# Fields every critical risk needs; True marks a 1-5 score
+_RISK_FIELDS = (
+    ("description", False),
+    ("impact", True),
+    ("probability", True),
+    ("mitigation", False),
+)
+
+
+def _validate_risk(i: int, risk: Any, errors: List[str]) -> None:
+    """Append schema errors for a single critical_risks entry."""
+    if not isinstance(risk, dict):
+        errors.append(f"critical_risks[{i}]: Must be an object")
+        return
+    for field, is_score in _RISK_FIELDS:
+        if field not in risk:
+            errors.append(f"critical_risks[{i}]: Missing {field}")
+        elif is_score:
+            value = risk[field]
+            if not isinstance(value, (int, float)) or not (1 <= value <= 5):
+                errors.append(f"critical_risks[{i}].{field}: Must be number 1-5")
 
 
 def validate_structured_brief(data: Any) -> JsonValidationResult:
@@ -54,82 +155,46 @@ def validate_structured_brief(data: Any) -> JsonValidationResult:
     Validate structured brief JSON against schema.
     Matches frontend validateStructuredBrief function.
     """
-    errors: List[str] = []
-    
     if not isinstance(data, dict):
         return JsonValidationResult(valid=False, errors=["Data must be a dictionary"])
     
-    # Required fields
-    required_fields = [
-        "recommendation",
-        "executive_summary", 
-        "rationale",
-        "critical_risks",
-        "immediate_actions",
-    ]
+    errors = _structured_brief_errors(data)
+    
+    return JsonValidationResult(
+        valid=len(errors) == 0,
+        errors=errors,
+        data=data if len(errors) == 0 else None
+    )
+
+
+def _structured_brief_errors(data: Dict[str, Any]) -> List[str]:
+    """Collect schema errors for a structured brief dictionary."""
+    errors: List[str] = []
     
-    for field in required_fields:
+    for field in _BRIEF_REQUIRED_FIELDS:
         if field not in data:
             errors.append(f"{field}: Required field missing")
     
-    # Validate rationale
-    rationale = data.get("rationale", [])
-    if not isinstance(rationale, list):
-        errors.append("rationale: Must be an array")
-    elif len(rationale) < 2:
-        errors.append("rationale: Must have at least 2 rationale points")
-    elif len(rationale) > 5:
-        errors.append("rationale: Should have at most 5 rationale points")
+    for field, min_items, max_items, noun in _BRIEF_ARRAY_RULES:
+        items = data.get(field, [])
+        if not isinstance(items, list):
+            errors.append(f"{field}: Must be an array")
+        elif len(items) < min_items:
+            errors.append(f"{field}: Must have at least {min_items} {noun}")
+        elif len(items) > max_items:
+            errors.append(f"{field}: Should have at most {max_items} {noun}")
+        elif field == "critical_risks":
+            for i, risk in enumerate(items):
+                _validate_risk(i, risk, errors)
     
-    # Validate critical_risks
-    critical_risks = data.get("critical_risks", [])
-    if not isinstance(critical_risks, list):
-        errors.append("critical_risks: Must be an array")
-    elif len(critical_risks) < 3:
-        errors.append("critical_risks: Must have at least 3 risks")
-    elif len(critical_risks) > 10:
-        errors.append("critical_risks: Should have at most 10 risks")
-    else:
-        # Validate each risk has required fields
-        for i, risk in enumerate(critical_risks):
-            if isinstance(risk, dict):
-                if "description" not in risk:
-                    errors.append(f"critical_risks[{i}]: Missing description")
-                if "impact" not in risk:
-                    errors.append(f"critical_risks[{i}]: Missing impact")
-                elif not isinstance(risk.get("impact"), (int, float)) or not (1 <= risk.get("impact", 0) <= 5):
-                    errors.append(f"critical_risks[{i}].impact: Must be number 1-5")
-                if "probability" not in risk:
-                    errors.append(f"critical_risks[{i}]: Missing probability")
-                elif not isinstance(risk.get("probability"), (int, float)) or not (1 <= risk.get("probability", 0) <= 5):
-                    errors.append(f"critical_risks[{i}].probability: Must be number 1-5")
-                if "mitigation" not in risk:
-                    errors.append(f"critical_risks[{i}]: Missing mitigation")
-            else:
-                errors.append(f"critical_risks[{i}]: Must be an object")
+    for field, min_length in _BRIEF_STRING_RULES:
+        value = data.get(field, "")
+        if not isinstance(value, str):
+            errors.append(f"{field}: Must be a string")
+        elif len(value.strip()) < min_length:
+            errors.append(f"{field}: Must be at least {min_length} characters")
     
-    # Validate immediate_actions
-    immediate_actions = data.get("immediate_actions", [])
-    if not isinstance(immediate_actions, list):
-        errors.append("immediate_actions: Must be an array")
-    elif len(immediate_actions) < 3:
-        errors.append("immediate_actions: Must have at least 3 actions")
-    elif len(immediate_actions) > 10:
-        errors.append("immediate_actions: Should have at most 10 actions")
-    
-    # Validate executive_summary
-    executive_summary = data.get("executive_summary", "")
-    if not isinstance(executive_summary, str):
-        errors.append("executive_summary: Must be a string")
-    elif len(executive_summary.strip()) < 50:
-        errors.append("executive_summary: Must be at least 50 characters")
-    
-    # Validate recommendation
-    recommendation = data.get("recommendation", "")
-    if not isinstance(recommendation, str):
-        errors.append("recommendation: Must be a string")
-    elif len(recommendation.strip()) < 20:
-        errors.append("recommendation: Must be at least 20 characters")
+    critical_risks = data.get("critical_risks", [])
     
     # Validate risk_matrix if present
     risk_matrix = data.get("risk_matrix")
@@ -146,23 +211,21 @@ def validate_structured_brief(data: Any) -> JsonValidationResult:
                 f"(one for each critical_risk), found {len(all_matrix_risks)}"
             )
     
-    return JsonValidationResult(
-        valid=len(errors) == 0,
-        errors=errors,
-        data=data if len(errors) == 0 else None
-    )
+    return errors
 
 
 def validate_html_structure(html: str) -> HtmlValidationResult:
     """
     Validate HTML structure for PDF generation.
-    Matches frontend validateHtmlStructure function.
+    Matches frontend validateHtmlStructure function, except that page-break and styling
+    rules are not required: brief.css supplies them when the page is printed, so the
+    Stage 2 output may rely on its classes alone.
     """
     errors: List[str] = []
     html_lower = html.lower()
     
-    # Check for DOCTYPE
-    if "<!doctype html>" not in html_lower and "<!doctype" not in html_lower:
+    # Check for DOCTYPE ("<!doctype html>" contains "<!doctype", so one scan covers both)
+    if "<!doctype" not in html_lower:
         errors.append("Missing DOCTYPE declaration")
     
     # Check for required HTML structure
@@ -173,28 +236,22 @@ def validate_html_structure(html: str) -> HtmlValidationResult:
     if "<body" not in html_lower:
         errors.append("Missing <body> tag")
     
-    # Check for page-break CSS (critical for PDF)
-    if "page-break-inside" not in html:
-        errors.append("Missing page-break CSS (required for PDF generation)")
-    
     # Check for required sections (case-insensitive)
     required_sections = ["executive", "summary", "recommendation"]
     has_required_content = any(section in html_lower for section in required_sections)
     if not has_required_content:
         errors.append("Missing required content sections (executive summary, recommendation)")
     
-    # Check for proper CSS styling
-    if "<style" not in html_lower and "style=" not in html_lower:
-        errors.append("Missing CSS styling (inline or <style> tag)")
-    
     # Check for valid HTML structure (basic check)
-    open_body_tags = len(re.findall(r'<body[^>]*>', html, re.IGNORECASE))
-    close_body_tags = len(re.findall(r'</body>', html, re.IGNORECASE))
+    # Count all four tags in one pass without materializing match lists
+    tag_counts = [0, 0, 0, 0, 0]
+    for match in _STRUCTURE_TAG_RE.finditer(html_lower):
+        # Every alternative is a capturing group, so lastindex is never None (slot 0 is unused)
+        tag_counts[match.lastindex or 0] += 1
+    _, open_body_tags, close_body_tags, open_html_tags, close_html_tags = tag_counts
     if open_body_tags != close_body_tags:
         errors.append("Mismatched <body> tags")
     
-    open_html_tags = len(re.findall(r'<html[^>]*>', html, re.IGNORECASE))
-    close_html_tags = len(re.findall(r'</html>', html, re.IGNORECASE))
     if open_html_tags != close_html_tags:
         errors.append("Mismatched <html> tags")
     
@@ -217,21 +274,94 @@ async def retry_with_backoff(
     
     for attempt in range(config.max_retries + 1):
         try:
-            return await fn()
-        except Exception as e:
+            if config.per_attempt_timeout_s is None:
+                return await fn()
+            return await asyncio.wait_for(fn(), timeout=config.per_attempt_timeout_s)
+        except Exception as e:  # includes asyncio.TimeoutError from a timed-out attempt
             last_error = e
             
             if attempt < config.max_retries:
                 if on_retry:
                     on_retry(attempt + 1, e)
                 
-                # Exponential backoff: 1s, 2s, 4s
-                delay = (config.retry_delay_ms / 1000) * (2 ** attempt)
-                await asyncio.sleep(delay)
+                # Exponential backoff (1s, 2s, 4s, capped) with full jitter so concurrent
+                # callers don't retry against the LLM provider in lockstep
+                delay = min(config.max_delay_ms, config.retry_delay_ms * (2 ** attempt)) / 1000
+                await asyncio.sleep(random.uniform(0, delay))
     
     raise last_error or Exception("Retry failed")
 
 
+# Accepted event_type spellings (snake_case and display name) per debate event kind
+_CONVERGENCE_TYPES = frozenset({"convergence", "Convergence"})
+_MODERATOR_RULING_TYPES = frozenset({"moderator_ruling", "Moderator Ruling"})
+_RED_TEAM_TYPES = frozenset({"red_team_critique", "Red Team Critique"})
+_TRANSLATOR_TYPES = frozenset({"translator_output", "Translator Output"})
+_POSITION_TYPES = frozenset({"position_card", "Position Card"})
+_CHALLENGE_TYPES = frozenset({"challenge", "Challenge"})
+_RESEARCH_TYPES = frozenset({"research_result", "Research Result"})
+_REBUTTAL_TYPES = frozenset({"rebuttal", "Rebuttal"})
+_FACT_CHECK_TYPES = frozenset({"fact_check", "Fact Check"})
+_CITATION_TYPES = frozenset({"citation_added", "Citation Added"})
+
+# Event type -> bucket used by extract_debate_content (one O(1) lookup per event)
+_EVENT_BUCKETS: Dict[str, str] = {
+    event_type: bucket
+    for bucket, event_types in (
+        ("convergence", _CONVERGENCE_TYPES),
+        ("moderator_ruling", _MODERATOR_RULING_TYPES),
+        ("red_team", _RED_TEAM_TYPES),
+        ("translator", _TRANSLATOR_TYPES),
+        ("positions", _POSITION_TYPES),
+        ("challenges", _CHALLENGE_TYPES),
+        ("research", _RESEARCH_TYPES),
+        ("rebuttals", _REBUTTAL_TYPES),
+        ("fact_checks", _FACT_CHECK_TYPES),
+        ("citations", _CITATION_TYPES),
+    )
+    for event_type in event_types
+}
+
+# Max events kept per list bucket; buckets not listed here keep only their first event
+_EVENT_BUCKET_LIMITS: Dict[str, int] = {
+    "positions": 3,
+    "challenges": 3,
+    "research": 5,
+    "rebuttals": 3,
+    "fact_checks": 3,
+    "citations": 5,
+}
+
+
+def _truncate(s: str, n: int) -> str:
+    """Cut s to n characters, adding an ellipsis only when something was cut."""
+    return s if len(s) <= n else s[:n] + "..."
+
+
+def _join_source_titles(sources: List[Any]) -> str:
+    """Comma-join each source's title (or URL), skipping non-dict and untitled entries."""
+    return ", ".join(
+        title
+        for source in sources
+        if isinstance(source, dict) and (title := source.get("title") or source.get("url"))
+    )
+
+
+# debate_content for a session with no events: every section empty or at its placeholder
+_EMPTY_DEBATE_TEMPLATE = "\n".join((
+    "FINAL JUDGMENT:", "", "",
+    "CONVERGENCE SUMMARY:", "", "",
+    "KEY POSITIONS:", "No positions recorded.", "",
+    "KEY CHALLENGES:", "No challenges recorded.", "",
+    "RED TEAM CRITIQUE:", "", "",
+    "RESEARCH FINDINGS:", "No research findings.", "",
+    "REBUTTALS:", "No rebuttals recorded.", "",
+    "FACT CHECKS:", "No fact checks.", "",
+    "CITATIONS:", "No citations.", "",
+    "TRANSLATOR OUTPUT:",
+))
+
+
 def extract_debate_content(session_json: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract debate content from session JSON for LLM processing.
@@ -245,68 +375,87 @@ def extract_debate_content(session_json: Dict[str, Any]) -> Dict[str, Any]:
     )
     events = session_json.get("events", [])
     
+    # New or aborted sessions have nothing to extract
+    if not events:
+        return {
+            "question": question,
+            "debate_content": _EMPTY_DEBATE_TEMPLATE,
+            "confidence": 0,
+            "research_findings": None,
+            "rebuttals": None,
+            "fact_checks": None,
+            "citations": None,
+            "translator_output": None,
+        }
+    
+    # Route every event into its bucket in a single pass. Singleton buckets keep the
+    # first matching event; list buckets stop filling once their limit is reached.
+    first_events: Dict[str, Dict[str, Any]] = {}
+    bucketed: Dict[str, List[Dict[str, Any]]] = {bucket: [] for bucket in _EVENT_BUCKET_LIMITS}
+    for event in events:
+        bucket = _EVENT_BUCKETS.get(event.get("event_type"))
+        if bucket is None:
+            continue
+        limit = _EVENT_BUCKET_LIMITS.get(bucket)
+        if limit is None:
+            first_events.setdefault(bucket, event)
+        elif len(bucketed[bucket]) < limit:
+            bucketed[bucket].append(event)
+    
     # Extract confidence from convergence event
     confidence = 0
-    convergence_event = None
     convergence_summary = ""
-    for event in events:
-        if event.get("event_type") in ("convergence", "Convergence"):
-            convergence_event = event
-            payload = event.get("payload", {})
-            if isinstance(payload, dict):
-                if "confidence" in payload:
-                    conf_value = payload["confidence"]
-                    if isinstance(conf_value, (int, float)):
-                        confidence = int(conf_value * 100) if conf_value <= 1 else int(conf_value)
-                if "summary" in payload:
-                    convergence_summary = str(payload["summary"])
-            break
+    convergence_event = first_events.get("convergence")
+    if convergence_event is not None:
+        payload = convergence_event.get("payload", {})
+        if isinstance(payload, dict):
+            if "confidence" in payload:
+                conf_value = payload["confidence"]
+                if isinstance(conf_value, (int, float)):
+                    confidence = int(conf_value * 100) if conf_value <= 1 else int(conf_value)
+            if "summary" in payload:
+                convergence_summary = str(payload["summary"])
     
     # Extract final ruling from moderator ruling event
     final_ruling = ""
-    for event in events:
-        if event.get("event_type") in ("moderator_ruling", "Moderator Ruling"):
-            payload = event.get("payload", {})
-            if isinstance(payload, dict):
-                final_ruling = str(payload.get("ruling", payload.get("notes", "")))
-            break
+    ruling_event = first_events.get("moderator_ruling")
+    if ruling_event is not None:
+        payload = ruling_event.get("payload", {})
+        if isinstance(payload, dict):
+            final_ruling = str(payload.get("ruling", payload.get("notes", "")))
     
     # Extract positions (position_card events) - limit to 3
     positions = []
-    position_events = [e for e in events if e.get("event_type") in ("position_card", "Position Card")]
-    for event in position_events[:3]:
+    for event in bucketed["positions"]:
         payload = event.get("payload", {})
         if isinstance(payload, dict):
             knight = payload.get("knight_name") or payload.get("knight_role") or "Unknown"
             headline = payload.get("headline", "")
             body = payload.get("body", "")
-            body_preview = body[:300] + "..." if len(body) > 300 else body
+            body_preview = _truncate(body, 300)
             positions.append(f"{knight}: {headline}\n{body_preview}")
     
     # Extract challenges - limit to 3
     challenges = []
-    challenge_events = [e for e in events if e.get("event_type") in ("challenge", "Challenge")]
-    for event in challenge_events[:3]:
+    for event in bucketed["challenges"]:
         payload = event.get("payload", {})
         if isinstance(payload, dict):
             contestation = str(payload.get("contestation", ""))
-            preview = contestation[:200] + "..." if len(contestation) > 200 else contestation
+            preview = _truncate(contestation, 200)
             if preview:
                 challenges.append(preview)
     
     # Extract red team critique
     red_team = ""
-    for event in events:
-        if event.get("event_type") in ("red_team_critique", "Red Team Critique"):
-            payload = event.get("payload", {})
-            if isinstance(payload, dict) and "critique" in payload:
-                red_team = str(payload["critique"])
-            break
+    red_team_event = first_events.get("red_team")
+    if red_team_event is not None:
+        payload = red_team_event.get("payload", {})
+        if isinstance(payload, dict) and "critique" in payload:
+            red_team = str(payload["critique"])
     
     # Extract research findings - limit to 5
     research_findings = []
-    research_events = [e for e in events if e.get("event_type") in ("research_result", "Research Result")]
-    for event in research_events[:5]:
+    for event in bucketed["research"]:
         payload = event.get("payload", {})
         if isinstance(payload, dict):
             query = payload.get("query", "")
@@ -314,15 +463,13 @@ def extract_debate_content(session_json: Dict[str, Any]) -> Dict[str, Any]:
             sources = payload.get("sources", [])
             sources_text = ""
             if sources:
-                source_titles = [s.get("title") or s.get("url", "") for s in sources if isinstance(s, dict)]
-                sources_text = f"\nSources: {', '.join(filter(None, source_titles))}"
+                sources_text = f"\nSources: {_join_source_titles(sources)}"
             if summary:
                 research_findings.append(f"Query: {query}\nFinding: {summary}{sources_text}")
     
     # Extract rebuttals - limit to 3
     rebuttals = []
-    rebuttal_events = [e for e in events if e.get("event_type") in ("rebuttal", "Rebuttal")]
-    for event in rebuttal_events[:3]:
+    for event in bucketed["rebuttals"]:
         payload = event.get("payload", {})
         if isinstance(payload, dict):
             knight = payload.get("knight_name") or payload.get("knight_id") or "Unknown"
@@ -330,13 +477,12 @@ def extract_debate_content(session_json: Dict[str, Any]) -> Dict[str, Any]:
             target = payload.get("target_knight_id", "")
             if content:
                 target_text = f" (responding to {target})" if target else ""
-                content_preview = content[:300] + "..." if len(content) > 300 else content
+                content_preview = _truncate(content, 300)
                 rebuttals.append(f"{knight}{target_text}: {content_preview}")
     
     # Extract fact checks - limit to 3
     fact_checks = []
-    fact_check_events = [e for e in events if e.get("event_type") in ("fact_check", "Fact Check")]
-    for event in fact_check_events[:3]:
+    for event in bucketed["fact_checks"]:
         payload = event.get("payload", {})
         if isinstance(payload, dict):
             claim = payload.get("claim", "")
@@ -344,15 +490,13 @@ def extract_debate_content(session_json: Dict[str, Any]) -> Dict[str, Any]:
             sources = payload.get("sources", [])
             sources_text = ""
             if sources:
-                source_titles = [s.get("title") or s.get("url", "") for s in sources if isinstance(s, dict)]
-                sources_text = f"\nSources: {', '.join(filter(None, source_titles))}"
+                sources_text = f"\nSources: {_join_source_titles(sources)}"
             if claim and verdict:
                 fact_checks.append(f"Claim: {claim}\nVerdict: {verdict}{sources_text}")
     
     # Extract citations - limit to 5
     citations = []
-    citation_events = [e for e in events if e.get("event_type") in ("citation_added", "Citation Added")]
-    for event in citation_events[:5]:
+    for event in bucketed["citations"]:
         payload = event.get("payload", {})
         if isinstance(payload, dict):
             title = payload.get("title", "")
@@ -364,43 +508,29 @@ def extract_debate_content(session_json: Dict[str, Any]) -> Dict[str, Any]:
     
     # Extract translator output
     translator_output = ""
-    for event in events:
-        if event.get("event_type") in ("translator_output", "Translator Output"):
-            payload = event.get("payload", {})
-            if isinstance(payload, dict):
-                translator_output = str(payload.get("translated_content") or payload.get("content", ""))
-            break
+    translator_event = first_events.get("translator")
+    if translator_event is not None:
+        payload = translator_event.get("payload", {})
+        if isinstance(payload, dict):
+            translator_output = str(payload.get("translated_content") or payload.get("content", ""))
     
-    # Build comprehensive debate content (matches frontend exactly)
-    debate_content = f"""FINAL JUDGMENT:
-{final_ruling}
-
-CONVERGENCE SUMMARY:
-{convergence_summary}
-
-KEY POSITIONS:
-{chr(10).join(positions) if positions else 'No positions recorded.'}
-
-KEY CHALLENGES:
-{chr(10).join(challenges) if challenges else 'No challenges recorded.'}
-
-RED TEAM CRITIQUE:
-{red_team}
-
-RESEARCH FINDINGS:
-{chr(10).join(research_findings) if research_findings else 'No research findings.'}
-
-REBUTTALS:
-{chr(10).join(rebuttals) if rebuttals else 'No rebuttals recorded.'}
-
-FACT CHECKS:
-{chr(10).join(fact_checks) if fact_checks else 'No fact checks.'}
-
-CITATIONS:
-{chr(10).join(citations) if citations else 'No citations.'}
-
-TRANSLATOR OUTPUT:
-{translator_output}""".strip()
+    # Build comprehensive debate content (matches frontend exactly) as a list of
+    # lines joined once at the end, instead of one big nested f-string
+    parts: List[str] = ["FINAL JUDGMENT:", final_ruling, "", "CONVERGENCE SUMMARY:", convergence_summary, ""]
+    parts.append("KEY POSITIONS:")
+    parts.extend(positions or ("No positions recorded.",))
+    parts.extend(("", "KEY CHALLENGES:"))
+    parts.extend(challenges or ("No challenges recorded.",))
+    parts.extend(("", "RED TEAM CRITIQUE:", red_team, "", "RESEARCH FINDINGS:"))
+    parts.extend(research_findings or ("No research findings.",))
+    parts.extend(("", "REBUTTALS:"))
+    parts.extend(rebuttals or ("No rebuttals recorded.",))
+    parts.extend(("", "FACT CHECKS:"))
+    parts.extend(fact_checks or ("No fact checks.",))
+    parts.extend(("", "CITATIONS:"))
+    parts.extend(citations or ("No citations.",))
+    parts.extend(("", "TRANSLATOR OUTPUT:", translator_output))
+    debate_content = "\n".join(parts).strip()
     
     return {
         "question": question,
@@ -414,27 +544,9 @@ TRANSLATOR OUTPUT:
     }
 
 
-async def generate_structured_brief(debate_content: Dict[str, Any], user_id: str | None = None, db: AsyncSession | None = None) -> Dict[str, Any]:
-    """
-    Stage 1: Generate structured executive brief JSON from debate content using LLM.
-    Matches frontend's generateStructuredBrief function exactly.
-    Model: openai/gpt-5.1 (or PDF_STAGE1_MODEL env var)
-    Temperature: 0.3
-    
-    Args:
-        debate_content: Extracted debate content
-        user_id: User ID for API key resolution (required for Community Edition)
-    """
-    logger.info("[local_pdf_generator] Stage 1: Generating structured brief using LLM...")
-    
-    router = LLMRouter()
-    
-    # Get model from env (same as frontend) - defaults to "openai/gpt-5.1"
-    model = os.getenv("PDF_STAGE1_MODEL") or os.getenv("OPENAI_MODEL") or "openai/gpt-5.1"
-    temperature = float(os.getenv("PDF_STAGE1_TEMPERATURE", "0.3"))
-    
-    # Build prompt exactly matching frontend (from generateStructuredBrief.ts)
-    prompt = f"""You are a Senior McKinsey Engagement Manager specializing in board-level decision briefs. Your task is to synthesize a complex debate into a structured executive brief.
+# Static parts of the Stage 1 prompt (matches frontend generateStructuredBrief.ts).
+# Only the debate question, confidence and content vary per call.
+_STAGE1_PROMPT_HEADER = """You are a Senior McKinsey Engagement Manager specializing in board-level decision briefs. Your task is to synthesize a complex debate into a structured executive brief.
 
 ## FRAMEWORK: The Pyramid Principle (Bottom-Line Up Front)
 - Start with the answer (recommendation)
@@ -445,18 +557,9 @@ async def generate_structured_brief(debate_content: Dict[str, Any], user_id: str
 - Authoritative, sparse, data-driven
 - Avoid "fluff" words and hedging language
 - Clear and decisive
-- Suitable for C-suite presentation
-
-## DEBATE QUESTION
-{debate_content['question']}
-
-## CONFIDENCE LEVEL
-{debate_content['confidence']}%
-
-## DEBATE CONTENT
-{debate_content['debate_content']}
+- Suitable for C-suite presentation"""
 
-## YOUR TASK
+_STAGE1_PROMPT_TASK = """## YOUR TASK
 Extract and synthesize the following structured information:
 
 1. **bottom_line** (1-2 sentences): The absolute bottom-line decision - what should we do?
@@ -513,7 +616,7 @@ Extract and synthesize the following structured information:
 ## OUTPUT FORMAT
 You MUST respond with valid JSON only. Do not include markdown code blocks or any other text. The JSON must match this exact structure:
 
-{{
+{
   "bottom_line": "...",
   "opportunity": "...",
   "recommendation": "...",
@@ -521,39 +624,41 @@ You MUST respond with valid JSON only. Do not include markdown code blocks or an
   "executive_summary": "...",
   "rationale": ["...", "..."],
   "critical_risks": [
-    {{
+    {
       "description": "...",
       "impact": 3,
       "probability": 4,
       "mitigation": "..."
-    }}
+    }
   ],
   "immediate_actions": ["...", "..."],
   "critical_conditions": ["..."],
-  "confidence_level": {debate_content['confidence']},
+  "confidence_level": """
+
+_STAGE1_PROMPT_FOOTER = """,
   "quotable_insights": ["...", "..."],
-  "swot": {{
+  "swot": {
     "strengths": ["..."],
     "weaknesses": ["..."],
     "opportunities": ["..."],
     "threats": ["..."]
-  }},
-  "risk_matrix": {{
+  },
+  "risk_matrix": {
     "high_impact_high_prob": ["..."],
     "high_impact_low_prob": ["..."],
     "low_impact_high_prob": ["..."],
     "low_impact_low_prob": ["..."]
-  }},
+  },
   "timeline": [
-    {{
+    {
       "phase": "...",
       "duration": "...",
       "activities": ["..."],
       "deliverables": ["..."],
       "dependencies": ["..."]
-    }}
+    }
   ]
-}}
+}
 
 ## CRITICAL INSTRUCTIONS
 - Ensure risk_matrix contains exactly the same number of risks as critical_risks
@@ -561,6 +666,139 @@ You MUST respond with valid JSON only. Do not include markdown code blocks or an
 - Be specific and actionable - avoid vague language
 - Use the confidence level provided to calibrate your recommendation strength
 - If confidence is low (<60%), emphasize risks and conditions more heavily"""
+
+_STRING_ARRAY: Dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+_SCORE: Dict[str, Any] = {"type": "integer", "minimum": 1, "maximum": 5}
+
+# JSON schema for Stage 1 structured output, mirroring the prompt's OUTPUT FORMAT. Array
+# bounds and required fields come from the validate_structured_brief tables so the two
+# can't drift; not strict because timeline and the analysis sections are optional.
+_STAGE1_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "bottom_line": {"type": "string"},
+        "opportunity": {"type": "string"},
+        "recommendation": {"type": "string"},
+        "requirement": {"type": "string"},
+        "executive_summary": {"type": "string"},
+        "rationale": dict(_STRING_ARRAY),
+        "critical_risks": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "description": {"type": "string"},
+                    "impact": _SCORE,
+                    "probability": _SCORE,
+                    "mitigation": {"type": "string"},
+                },
+                "required": [field for field, _ in _RISK_FIELDS],
+            },
+        },
+        "immediate_actions": dict(_STRING_ARRAY),
+        "critical_conditions": _STRING_ARRAY,
+        "confidence_level": {"type": "number"},
+        "quotable_insights": _STRING_ARRAY,
+        "swot": {
+            "type": "object",
+            "properties": {
+                quadrant: _STRING_ARRAY
+                for quadrant in ("strengths", "weaknesses", "opportunities", "threats")
+            },
+        },
+        "risk_matrix": {
+            "type": "object",
+            "properties": {
+                cell: _STRING_ARRAY
+                for cell in (
+                    "high_impact_high_prob",
+                    "high_impact_low_prob",
+                    "low_impact_high_prob",
+                    "low_impact_low_prob",
+                )
+            },
+        },
+        "timeline": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "phase": {"type": "string"},
+                    "duration": {"type": "string"},
+                    "activities": _STRING_ARRAY,
+                    "deliverables": _STRING_ARRAY,
+                    "dependencies": _STRING_ARRAY,
+                },
+            },
+        },
+    },
+    "required": list(_BRIEF_REQUIRED_FIELDS),
+}
+for _field, _min_items, _max_items, _ in _BRIEF_ARRAY_RULES:
+    _STAGE1_RESPONSE_SCHEMA["properties"][_field].update(minItems=_min_items, maxItems=_max_items)
+del _field, _min_items, _max_items
+
+_STAGE1_JSON_SCHEMA: Dict[str, Any] = {
+    "name": "structured_brief",
+    "schema": _STAGE1_RESPONSE_SCHEMA,
+    "strict": False,
+}
+
+# Structured brief returned when Stage 1 fails after retries. Deep-copied per use since
+# callers may mutate it; executive_summary and confidence_level are filled from the debate.
+_STAGE1_FALLBACK: Dict[str, Any] = {
+    "bottom_line": "Review the expert positions and take action based on the analysis.",
+    "opportunity": "",
+    "recommendation": "Review the expert positions and take action based on the analysis.",
+    "requirement": "",
+    "executive_summary": "",
+    "rationale": ["Analysis based on debate content", "Expert positions synthesized", "Further review recommended"],
+    "critical_risks": [
+        {"description": "Implementation complexity", "impact": 3, "probability": 3, "mitigation": "Phased approach"},
+        {"description": "Resource constraints", "impact": 3, "probability": 3, "mitigation": "Resource planning"},
+        {"description": "Timeline risks", "impact": 3, "probability": 3, "mitigation": "Buffer time"},
+    ],
+    "immediate_actions": ["Review analysis", "Validate assumptions", "Plan next steps"],
+    "critical_conditions": [],
+    "confidence_level": 75,
+    "quotable_insights": [],
+    "swot": {"strengths": [], "weaknesses": [], "opportunities": [], "threats": []},
+    "risk_matrix": {"high_impact_high_prob": [], "high_impact_low_prob": [], "low_impact_high_prob": [], "low_impact_low_prob": []},
+    "timeline": [],
+}
+
+
+async def generate_structured_brief(debate_content: Dict[str, Any], user_id: str | None = None, db: AsyncSession | None = None) -> Tuple[Dict[str, Any], bool]:
+    """
+    Stage 1: Generate structured executive brief JSON from debate content using LLM.
+    Matches frontend's generateStructuredBrief function exactly.
+    Model: openai/gpt-5.1 (or PDF_STAGE1_MODEL env var)
+    Temperature: 0.3
+    
+    Args:
+        debate_content: Extracted debate content
+        user_id: User ID for API key resolution (required for Community Edition)
+    
+    Returns:
+        (structured_brief, from_llm); from_llm is False when the basic fallback was used
+    """
+    logger.info("[local_pdf_generator] Stage 1: Generating structured brief using LLM...")
+    
+    router = _get_router()
+    
+    # Get model from env (same as frontend) - defaults to "openai/gpt-5.1"
+    model = os.getenv("PDF_STAGE1_MODEL") or os.getenv("OPENAI_MODEL") or "openai/gpt-5.1"
+    temperature = float(os.getenv("PDF_STAGE1_TEMPERATURE", "0.3"))
+    attempt_timeout_s = float(os.getenv("PDF_STAGE1_ATTEMPT_TIMEOUT_S", "60"))
+    
+    # Build prompt exactly matching frontend (from generateStructuredBrief.ts)
+    prompt = (
+        f"{_STAGE1_PROMPT_HEADER}\n\n"
+        f"## DEBATE QUESTION\n{debate_content['question']}\n\n"
+        f"## CONFIDENCE LEVEL\n{debate_content['confidence']}%\n\n"
+        f"## DEBATE CONTENT\n{debate_content['debate_content']}\n\n"
+        f"{_STAGE1_PROMPT_TASK}{debate_content['confidence']}{_STAGE1_PROMPT_FOOTER}"
+    )
     
     async def _generate():
         request = LLMRequest(
@@ -569,32 +807,26 @@ You MUST respond with valid JSON only. Do not include markdown code blocks or an
             model=model,
             temperature=temperature,
             json_mode=True,
+            json_schema=_STAGE1_JSON_SCHEMA,
         )
         
         # Pass user_id and db to router.generate() for API key resolution, not to LLMRequest
         response = await router.generate(request, user_id=user_id, db=db)
         
-        # Parse JSON response
-        json_str = response.strip()
-        # Remove markdown code blocks if present
-        if json_str.startswith("```json"):
-            json_str = json_str[7:].strip()
-        elif json_str.startswith("```"):
-            json_str = json_str[3:].strip()
-        if json_str.endswith("```"):
-            json_str = json_str[:-3].strip()
+        # Parse JSON response, removing markdown code fences if present
+        json_str = _JSON_FENCE_RE.match(response).group(1)
         
         # Parse JSON
         try:
-            parsed_json = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            parsed_json = orjson.loads(json_str)
+        except orjson.JSONDecodeError as e:
             raise Exception(f"Failed to parse JSON: {e}")
         
         # Validate against schema
         validation = validate_structured_brief(parsed_json)
         if not validation.valid:
             # Log validation errors but don't fail - LLM output may still be usable
-            logger.warning(f"[local_pdf_generator] Stage 1 validation warnings: {validation.errors}")
+            logger.warning("[local_pdf_generator] Stage 1 validation warnings: %s", validation.errors)
         
         return parsed_json
     
@@ -602,64 +834,97 @@ You MUST respond with valid JSON only. Do not include markdown code blocks or an
         # Use retry with backoff (matches frontend)
         structured_brief = await retry_with_backoff(
             _generate,
-            RetryConfig(max_retries=2, retry_delay_ms=1000),
+            RetryConfig(max_retries=2, retry_delay_ms=1000, per_attempt_timeout_s=attempt_timeout_s),
             lambda attempt, error: logger.warning(
-                f"[local_pdf_generator] Stage 1 attempt {attempt} failed, retrying... Error: {error}"
+                "[local_pdf_generator] Stage 1 attempt %s failed, retrying... Error: %s", attempt, error
             )
         )
         logger.info("[local_pdf_generator] Stage 1 complete: Structured brief generated successfully")
-        return structured_brief
+        return structured_brief, True
         
     except Exception as e:
         logger.error(f"[local_pdf_generator] Stage 1 error after retries: {e}", exc_info=True)
         # Fallback to basic structure
-        return {
-            "bottom_line": "Review the expert positions and take action based on the analysis.",
-            "opportunity": "",
-            "recommendation": "Review the expert positions and take action based on the analysis.",
-            "requirement": "",
-            "executive_summary": debate_content.get("debate_content", "Analysis complete.")[:500],
-            "rationale": ["Analysis based on debate content", "Expert positions synthesized", "Further review recommended"],
-            "critical_risks": [
-                {"description": "Implementation complexity", "impact": 3, "probability": 3, "mitigation": "Phased approach"},
-                {"description": "Resource constraints", "impact": 3, "probability": 3, "mitigation": "Resource planning"},
-                {"description": "Timeline risks", "impact": 3, "probability": 3, "mitigation": "Buffer time"},
-            ],
-            "immediate_actions": ["Review analysis", "Validate assumptions", "Plan next steps"],
-            "critical_conditions": [],
-            "confidence_level": debate_content.get("confidence", 75),
-            "quotable_insights": [],
-            "swot": {"strengths": [], "weaknesses": [], "opportunities": [], "threats": []},
-            "risk_matrix": {"high_impact_high_prob": [], "high_impact_low_prob": [], "low_impact_high_prob": [], "low_impact_low_prob": []},
-            "timeline": [],
-        }
+        fallback = copy.deepcopy(_STAGE1_FALLBACK)
+        fallback["executive_summary"] = debate_content.get("debate_content", "Analysis complete.")[:500]
+        fallback["confidence_level"] = debate_content.get("confidence", 75)
+        return fallback, False
+
+
+# Stage 2 HTML cache: identical briefs (same question, confidence, date, model and user)
+# reuse the rendered HTML instead of calling the LLM again. An in-process LRU sits in
+# front of Redis so repeats within one worker skip the network round trip too.
+STAGE2_CACHE_TTL_SECONDS = int(os.getenv("PDF_STAGE2_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+STAGE2_CACHE_MAX_ENTRIES = int(os.getenv("PDF_STAGE2_CACHE_MAX_ENTRIES", "32"))
+
+_stage2_html_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _stage2_cache_key(
+    structured_brief: Dict[str, Any],
+    debate_content: Dict[str, Any],
+    date: str,
+    model: str,
+    user_id: str | None,
+) -> str:
+    """Hash everything that feeds the Stage 2 prompt (static prefix included) and model choice."""
+    canonical = orjson.dumps(
+        [
+            _STAGE2_PROMPT_DIGEST,
+            structured_brief,
+            debate_content["question"],
+            debate_content["confidence"],
+            date,
+            model,
+            user_id,
+        ],
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return f"pdf:stage2_html:{hashlib.sha256(canonical).hexdigest()}"
 
 
-async def render_brief_html(structured_brief: Dict[str, Any], debate_content: Dict[str, Any], user_id: str | None = None, db: AsyncSession | None = None) -> str:
-    """
-    Stage 2: Render structured brief JSON to HTML using LLM.
-    Matches frontend's renderBriefHtml function exactly.
-    Model: anthropic/claude-sonnet-4.5 (or PDF_STAGE2_MODEL env var)
-    Temperature: 0.3
-    
-    Args:
-        structured_brief: Structured brief JSON from Stage 1
-        debate_content: Original debate content
-        user_id: User ID for API key resolution (required for Community Edition)
-    """
-    logger.info("[local_pdf_generator] Stage 2: Rendering HTML from structured brief using LLM...")
-    
-    router = LLMRouter()
-    
-    # Get model from env (same as frontend) - defaults to "anthropic/claude-sonnet-4.5"
-    model = os.getenv("PDF_STAGE2_MODEL") or "anthropic/claude-sonnet-4.5"
-    temperature = float(os.getenv("PDF_STAGE2_TEMPERATURE", "0.3"))
-    
-    # Format date as YYYY.M.D (same as frontend)
-    date = datetime.now().strftime("%Y.%-m.%-d") if os.name != 'nt' else datetime.now().strftime("%Y.%#m.%#d")
-    
-    # Build prompt exactly matching frontend (from renderBriefHtml.ts)
-    prompt = f"""You are a Senior Frontend Developer specializing in creating professional HTML documents for PDF conversion. Your task is to convert structured executive brief data into a beautiful, print-ready HTML document.
+def _get_cached_stage2_html(key: str) -> Optional[str]:
+    """Look up rendered HTML in the local LRU, then Redis. Never raises."""
+    html = _stage2_html_cache.get(key)
+    if html is not None:
+        _stage2_html_cache.move_to_end(key)
+        return html
+    try:
+        redis = get_redis_client()
+        if redis is None:
+            return None
+        cached = redis.get(key)
+    except Exception as e:
+        logger.warning(f"[local_pdf_generator] Stage 2 cache lookup failed: {e}")
+        return None
+    if isinstance(cached, str) and cached:
+        _remember_stage2_html(key, cached)
+        return cached
+    return None
+
+
+def _remember_stage2_html(key: str, html: str) -> None:
+    _stage2_html_cache[key] = html
+    _stage2_html_cache.move_to_end(key)
+    while len(_stage2_html_cache) > STAGE2_CACHE_MAX_ENTRIES:
+        _stage2_html_cache.popitem(last=False)
+
+
+def _store_stage2_html(key: str, html: str) -> None:
+    """Cache rendered HTML locally and in Redis (best effort)."""
+    _remember_stage2_html(key, html)
+    try:
+        redis = get_redis_client()
+        if redis is not None:
+            redis.set(key, html, ex=STAGE2_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"[local_pdf_generator] Failed to store Stage 2 HTML in cache: {e}")
+
+
+# Static parts of the Stage 2 prompt (based on frontend renderBriefHtml.ts): the design
+# system prose, and the HTML structure rules after the header bullet. Base CSS lives in
+# brief.css and is injected at render time, so the model only writes extra styles.
+_STAGE2_PROMPT_HEADER = """You are a Senior Frontend Developer specializing in creating professional HTML documents for PDF conversion. Your task is to convert structured executive brief data into a beautiful, print-ready HTML document.
 
 ## DESIGN SYSTEM
 
@@ -691,38 +956,20 @@ async def render_brief_html(structured_brief: Dict[str, Any], debate_content: Di
 
 ## CRITICAL PDF REQUIREMENTS
 
-1. **Page Breaks**: You MUST use `page-break-inside: avoid;` on ALL major sections, cards, and boxes to prevent content from being split across pages.
+1. **Page Breaks**: Wrap each major section in the base `.section` class (it already keeps sections from splitting across pages). Only add `page-break-inside: avoid;` yourself for custom blocks such as the SWOT grid, risk matrix and timeline phases.
 
-2. **Complete HTML Structure**: Include <!DOCTYPE html>, <html>, <head>, and <body> tags.
+2. **Body Content Only**: Output only what goes inside <body>. The <!DOCTYPE html>, <html>, <head>, and <body> wrapper is added automatically - do NOT include it.
 
-3. **Inline CSS**: All styles must be inline or in a <style> tag in the <head>. No external stylesheets.
+3. **Base Stylesheet**: A base stylesheet is applied automatically during PDF conversion (see BASE STYLESHEET below). Do NOT repeat its rules. Put any additional styles inline or in a single <style> tag at the start of your output. No external stylesheets.
 
 4. **Print-Friendly**: Use CSS that works well for print/PDF conversion.
 
-5. **Footer**: Do NOT include a footer in the HTML. The footer will be added automatically during PDF conversion.
-
-## STRUCTURED DATA TO RENDER
-
-```json
-{json.dumps(structured_brief, indent=2)}
-```
-
-## ADDITIONAL CONTEXT
-- **Question**: {debate_content['question']}
-- **Confidence**: {debate_content['confidence']}%
-- **Date**: {date}
-
-## HTML STRUCTURE REQUIREMENTS
+5. **Footer**: Do NOT include a footer in the HTML. The footer will be added automatically during PDF conversion."""
 
-1. **Header Section** (at top of first page):
-   - Left side: Logo text "CRUCIBLE" where "CRU" is black and "CIBLE" is #fec76f
-   - Font-weight: 800, Letter-spacing: 2px
-   - Right side: "EXECUTIVE BRIEF | {date}" in small caps, color #888
-
-2. **Executive Summary Section** (COMPACT):
+_STAGE2_PROMPT_STRUCTURE_RULES = """2. **Executive Summary Section** (COMPACT):
    - Smaller heading (H2 size: 18px)
    - Render the executive_summary as 2-3 concise paragraphs (max 4-5 sentences total)
-   - Use page-break-inside: avoid
+   - Wrap it in a `.section`
    - Keep it to 1/3 page or less
 
 3. **Recommendation Box** (COMPACT):
@@ -767,89 +1014,22 @@ async def render_brief_html(structured_brief: Dict[str, Any], debate_content: Di
 
 8. **Footer Note**: Do NOT include a footer in the HTML. The footer (with date and page numbers) will be added automatically during PDF generation.
 
-## EXAMPLE HTML STRUCTURE
+## BASE STYLESHEET (applied automatically - do not repeat)
+- `body`: Arial/Helvetica 11px, line-height 1.5, black on white; `*` reset (box-sizing, zero margin/padding)
+- `h1` / `h2` / `h3`: Georgia serif, color #324154, 24px / 18px / 14px
+- `.section`: page-break-inside: avoid, 16px bottom margin
+- `.two-column`: 2-column grid with 16px gap
+- `.recommendation-box`: #F5F6F7 background, 3px #D9A441 left border, 16px padding, page-break-inside: avoid
+- `.compact-list`: tight list spacing (16px indent, 4px between items)
+- `@page`: A4, 20mm margins (30mm bottom)
 
-```html
-<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Executive Brief</title>
-  <style>
-    @page {{
-      size: A4;
-      margin: 20mm 20mm 30mm 20mm;
-    }}
-    * {{
-      box-sizing: border-box;
-      margin: 0;
-      padding: 0;
-    }}
-    body {{
-      font-family: 'Arial', 'Helvetica', sans-serif;
-      font-size: 11px;
-      line-height: 1.5;
-      color: #000000;
-      background: #ffffff;
-    }}
-    .section {{
-      page-break-inside: avoid;
-      margin-bottom: 16px;
-    }}
-    h1 {{
-      font-family: 'Georgia', 'Times New Roman', serif;
-      color: #324154;
-      font-size: 24px;
-      margin-bottom: 12px;
-    }}
-    h2 {{
-      font-family: 'Georgia', 'Times New Roman', serif;
-      color: #324154;
-      font-size: 18px;
-      margin-bottom: 10px;
-    }}
-    h3 {{
-      font-family: 'Georgia', 'Times New Roman', serif;
-      color: #324154;
-      font-size: 14px;
-      margin-bottom: 8px;
-    }}
-    .two-column {{
-      display: grid;
-      grid-template-columns: 1fr 1fr;
-      gap: 16px;
-      margin-bottom: 16px;
-    }}
-    .recommendation-box {{
-      background: #F5F6F7;
-      border-left: 3px solid #D9A441;
-      padding: 16px;
-      margin: 16px 0;
-      page-break-inside: avoid;
-      font-size: 11px;
-    }}
-    .compact-list {{
-      margin: 8px 0;
-      padding-left: 16px;
-    }}
-    .compact-list li {{
-      margin-bottom: 4px;
-      line-height: 1.4;
-    }}
-  </style>
-</head>
-<body>
-  <!-- Your rendered content here -->
-</body>
-</html>
-```
+Use these class names; your own <style> rules override them where needed.
 
 ## FINAL INSTRUCTIONS (CRITICAL - COMPACT DESIGN)
 
 1. Generate ONLY the raw HTML code
 2. Do NOT include markdown code blocks (like ```html)
-3. Start immediately with `<!DOCTYPE html>`
+3. Start immediately with your <style> tag (only styles the base stylesheet does not provide: SWOT grid, risk matrix, timeline, badges) or the first section - no <!DOCTYPE html>, <html>, <head>, or <body> tags
 4. **TARGET: 2-3 pages maximum** - Be extremely concise with all content
 5. Use multi-column layouts (2-column grid) for sections like:
    - Opportunity + Requirement side by side
@@ -859,10 +1039,88 @@ async def render_brief_html(structured_brief: Dict[str, Any], debate_content: Di
 7. **MUST INCLUDE**: Risk Matrix, SWOT Analysis, and Timeline (if present in data) - make them compact but visible
 8. Use smaller fonts (11px body, 18px H2, 24px H1)
 9. Reduce all spacing (16px margins instead of 32px)
-10. Ensure ALL sections have `page-break-inside: avoid;` in their CSS
-11. Make it visually appealing and professional despite compact size
-12. Use semantic HTML5 elements where appropriate
-13. Ensure the document is self-contained (all CSS inline or in <style> tag)"""
+10. Make it visually appealing and professional despite compact size
+11. Use semantic HTML5 elements where appropriate
+12. Ensure the content is self-contained apart from the base stylesheet (extra CSS inline or in a <style> tag)"""
+
+# Document wrapper for Stage 2 output: the LLM only writes what goes inside <body>,
+# so it doesn't spend output tokens regenerating this boilerplate on every call.
+# No styles here: brief.css is added when the page is printed, and
+# validate_html_structure does not expect the wrapped document to carry its own CSS.
+_BRIEF_HTML_SHELL = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>Executive Brief</title>
+</head>
+<body>
+{{CONTENT}}
+</body>
+</html>"""
+
+# Everything static in the Stage 2 prompt, sent ahead of the per-brief data as one block
+# so providers can cache it. Well above the ~1K-token minimum for Anthropic caching.
+_STAGE2_PROMPT_PREFIX = (
+    f"{_STAGE2_PROMPT_HEADER}\n\n"
+    "## HTML STRUCTURE REQUIREMENTS\n\n"
+    "1. **Header Section** (at top of first page):\n"
+    '   - Left side: Logo text "CRUCIBLE" where "CRU" is black and "CIBLE" is #fec76f\n'
+    "   - Font-weight: 800, Letter-spacing: 2px\n"
+    '   - Right side: "EXECUTIVE BRIEF | <Date from ADDITIONAL CONTEXT>" in small caps, color #888\n\n'
+    f"{_STAGE2_PROMPT_STRUCTURE_RULES}\n\n"
+)
+# Part of the Stage 2 cache key, so a deploy that changes the prompt never serves old HTML
+_STAGE2_PROMPT_DIGEST = hashlib.sha256(_STAGE2_PROMPT_PREFIX.encode("utf-8")).hexdigest()
+
+
+async def render_brief_html(structured_brief: Dict[str, Any], debate_content: Dict[str, Any], user_id: str | None = None, db: AsyncSession | None = None) -> Tuple[str, bool]:
+    """
+    Stage 2: Render structured brief JSON to HTML using LLM.
+    Matches frontend's renderBriefHtml function exactly.
+    Model: anthropic/claude-sonnet-4.5 (or PDF_STAGE2_MODEL env var)
+    Temperature: 0.3
+    
+    Args:
+        structured_brief: Structured brief JSON from Stage 1
+        debate_content: Original debate content
+        user_id: User ID for API key resolution (required for Community Edition)
+    
+    Returns:
+        (html, from_llm); from_llm is False when the fallback template was used
+    """
+    logger.info("[local_pdf_generator] Stage 2: Rendering HTML from structured brief using LLM...")
+    
+    router = _get_router()
+    
+    # Get model from env (same as frontend) - defaults to "anthropic/claude-sonnet-4.5"
+    model = os.getenv("PDF_STAGE2_MODEL") or "anthropic/claude-sonnet-4.5"
+    temperature = float(os.getenv("PDF_STAGE2_TEMPERATURE", "0.3"))
+    # Stage 2 emits the whole rendered brief, so an attempt legitimately runs longer than Stage 1
+    attempt_timeout_s = float(os.getenv("PDF_STAGE2_ATTEMPT_TIMEOUT_S", "180"))
+    
+    # Format date as YYYY.M.D (same as frontend)
+    date = datetime.now().strftime(_DATE_FMT)
+    
+    cache_key = _stage2_cache_key(structured_brief, debate_content, date, model, user_id)
+    cached_html = _get_cached_stage2_html(cache_key)
+    if cached_html is not None:
+        logger.info("[local_pdf_generator] Stage 2 cache hit, skipping LLM call")
+        return cached_html, True
+    
+    # Serialize the brief once; the prompt is built outside _generate so retries reuse it
+    brief_json = orjson.dumps(structured_brief, option=orjson.OPT_INDENT_2).decode()
+    
+    # Same instructions as the frontend (renderBriefHtml.ts), reordered so the static
+    # rules go first as a cacheable prefix; only the data below varies per call
+    prompt = (
+        "## STRUCTURED DATA TO RENDER\n\n"
+        f"```json\n{brief_json}\n```\n\n"
+        "## ADDITIONAL CONTEXT\n"
+        f"- **Question**: {debate_content['question']}\n"
+        f"- **Confidence**: {debate_content['confidence']}%\n"
+        f"- **Date**: {date}"
+    )
 
     async def _generate():
         request = LLMRequest(
@@ -871,19 +1129,14 @@ async def render_brief_html(structured_brief: Dict[str, Any], debate_content: Di
             model=model,
             temperature=temperature,
             json_mode=False,  # HTML output, not JSON
+            cache_prefix=_STAGE2_PROMPT_PREFIX,
         )
         
         # Pass user_id and db to router.generate() for API key resolution
         response = await router.generate(request, user_id=user_id, db=db)
         
         # Clean up the HTML - remove markdown code blocks if present
-        html = response.strip()
-        if html.startswith("```html"):
-            html = html[7:].strip()
-        elif html.startswith("```"):
-            html = html[3:].strip()
-        if html.endswith("```"):
-            html = html[:-3].strip()
+        html = _HTML_FENCE_RE.match(response).group(1)
         
         # Check for complete HTML structure (both opening and closing tags)
         html_lower = html.lower()
@@ -892,34 +1145,18 @@ async def render_brief_html(structured_brief: Dict[str, Any], debate_content: Di
         has_opening_body = "<body" in html_lower
         has_closing_body = "</body>" in html_lower
         
-        # If HTML structure is incomplete or malformed, rebuild it properly
+        # The LLM is asked for body content only; anything short of a complete document
+        # (body-only output, or a partial one) gets wrapped in the fixed shell
         if not has_opening_html or not has_closing_html or not has_opening_body or not has_closing_body:
             # Extract body content if partial HTML exists
             body_content = html
             if has_opening_body:
-                # Try to extract content between <body> tags
-                import re
-                body_match = re.search(r'<body[^>]*>(.*?)</body>', html, re.DOTALL | re.IGNORECASE)
+                body_match = _BODY_CONTENT_RE.search(html)
                 if body_match:
                     body_content = body_match.group(1).strip()
-                else:
-                    # Has opening body tag but no closing, extract everything after <body>
-                    body_match = re.search(r'<body[^>]*>(.*)', html, re.DOTALL | re.IGNORECASE)
-                    if body_match:
-                        body_content = body_match.group(1).strip()
             
-            # Rebuild complete HTML structure
-            html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>Executive Brief</title>
-</head>
-<body>
-{body_content}
-</body>
-</html>"""
+            # Wrap in the fixed document shell
+            html = _BRIEF_HTML_SHELL.replace("{{CONTENT}}", body_content)
         elif not html_lower.startswith("<!doctype"):
             # Has complete structure but missing DOCTYPE
             html = f"<!DOCTYPE html>\n{html}"
@@ -935,18 +1172,23 @@ async def render_brief_html(structured_brief: Dict[str, Any], debate_content: Di
         # Use retry with backoff (matches frontend)
         html = await retry_with_backoff(
             _generate,
-            RetryConfig(max_retries=2, retry_delay_ms=1000),
+            RetryConfig(max_retries=2, retry_delay_ms=1000, per_attempt_timeout_s=attempt_timeout_s),
             lambda attempt, error: logger.warning(
-                f"[local_pdf_generator] Stage 2 attempt {attempt} failed, retrying... Error: {error}"
+                "[local_pdf_generator] Stage 2 attempt %s failed, retrying... Error: %s", attempt, error
             )
         )
         logger.info(f"[local_pdf_generator] Stage 2 complete: HTML generated, length: {len(html)} chars")
-        return html
+        _store_stage2_html(cache_key, html)
+        return html, True
         
     except Exception as e:
         logger.error(f"[local_pdf_generator] Stage 2 error after retries: {e}", exc_info=True)
         # Fallback to basic HTML
-        return generate_fallback_html(structured_brief, debate_content)
+        return generate_fallback_html(structured_brief, debate_content), False
+
+
+# Compiled once at import; autoescaped since the brief text is LLM output
+_FALLBACK_TEMPLATE = get_fallback_brief_template()
 
 
 def generate_fallback_html(structured_brief: Dict[str, Any], debate_content: Dict[str, Any]) -> str:
@@ -954,82 +1196,37 @@ def generate_fallback_html(structured_brief: Dict[str, Any], debate_content: Dic
     Generate fallback HTML if LLM fails.
     Uses the same design system as the frontend.
     """
-    date = datetime.now().strftime("%Y.%m.%d")
-    
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="UTF-8">
-  <title>Executive Brief</title>
-  <style>
-    * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-    body {{
-      font-family: 'Arial', 'Helvetica', sans-serif;
-      font-size: 11px;
-      line-height: 1.5;
-      color: #000000;
-      background: #ffffff;
-      padding: 40px;
-    }}
-    .header {{
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      margin-bottom: 24px;
-      border-bottom: 2px solid #e2e8f0;
-      padding-bottom: 16px;
-    }}
-    .logo {{ font-weight: 800; font-size: 18px; letter-spacing: 2px; }}
-    .logo .cru {{ color: #000000; }}
-    .logo .cible {{ color: #fec76f; }}
-    .meta {{ color: #888; font-size: 10px; text-transform: uppercase; }}
-    h1 {{ font-family: 'Georgia', serif; color: #324154; font-size: 24px; margin-bottom: 16px; }}
-    h2 {{ font-family: 'Georgia', serif; color: #324154; font-size: 18px; margin-bottom: 12px; margin-top: 24px; }}
-    .section {{ page-break-inside: avoid; margin-bottom: 20px; }}
-    .recommendation-box {{
-      background: #F5F6F7;
-      border-left: 3px solid #D9A441;
-      padding: 16px;
-      margin: 16px 0;
-    }}
-    ul, ol {{ margin: 8px 0; padding-left: 20px; }}
-    li {{ margin-bottom: 4px; }}
-  </style>
-</head>
-<body>
-  <div class="header">
-    <div class="logo"><span class="cru">CRU</span><span class="cible">CIBLE</span></div>
-    <div class="meta">EXECUTIVE BRIEF | {date}</div>
-  </div>
-  
-  <h1>{debate_content['question']}</h1>
-  
-  <div class="section">
-    <h2>Executive Summary</h2>
-    <p>{structured_brief.get('executive_summary', 'Analysis complete.')}</p>
-  </div>
-  
-  <div class="recommendation-box section">
-    <h2 style="margin-top:0;">Recommendation</h2>
-    <p>{structured_brief.get('recommendation', 'Review the analysis.')}</p>
-    <p style="margin-top:8px;"><strong>Confidence: {structured_brief.get('confidence_level', debate_content['confidence'])}%</strong></p>
-  </div>
-  
-  <div class="section">
-    <h2>Key Rationale</h2>
-    <ul>
-      {''.join([f'<li>{r}</li>' for r in structured_brief.get('rationale', ['No rationale provided.'])])}
-    </ul>
-  </div>
-  
-  <div class="section">
-    <h2>Immediate Actions</h2>
-    <ol>
-      {''.join([f'<li>{a}</li>' for a in structured_brief.get('immediate_actions', ['Review analysis.'])])}
-    </ol>
-  </div>
-</body>
-</html>"""
+    return _FALLBACK_TEMPLATE.render(
+        date=datetime.now().strftime("%Y.%m.%d"),
+        question=debate_content['question'],
+        executive_summary=structured_brief.get('executive_summary', 'Analysis complete.'),
+        recommendation=structured_brief.get('recommendation', 'Review the analysis.'),
+        confidence=structured_brief.get('confidence_level', debate_content['confidence']),
+        rationale=structured_brief.get('rationale', ['No rationale provided.']),
+        immediate_actions=structured_brief.get('immediate_actions', ['Review analysis.']),
+    )
+
+
+async def _open_render_page() -> Tuple[Any, Any]:
+    """Open a fresh browser context and a blank page in it, ready for set_content."""
+    context = await browser_pool.get_context()
+    try:
+        page = await context.new_page()
+        # Lay the brief out with print CSS from the start rather than re-laying it out in page.pdf()
+        await page.emulate_media(media="print")
+    except BaseException:
+        await context.close()
+        raise
+    return context, page
+
+
+async def _discard_browser_task(task: asyncio.Task) -> None:
+    """Wait for a prefetched get_browser task and drop its result or error."""
+    # Never cancel it: a launch cut short mid-way can leave a Chromium process behind.
+    # asyncio.wait does not cancel it and the browser stays shared for the next PDF.
+    await asyncio.wait([task])
+    if not task.cancelled():
+        task.exception()
 
 
 async def generate_pdf_from_session_json(
@@ -1038,7 +1235,7 @@ async def generate_pdf_from_session_json(
     use_llm: bool = True,
     user_id: str | None = None,
     db: AsyncSession | None = None,
-) -> bytes:
+) -> Tuple[bytes, bool]:
     """
     Generate a PDF from session JSON data using TWO-STAGE LLM pipeline + Playwright.
     
@@ -1056,31 +1253,46 @@ async def generate_pdf_from_session_json(
         db: Database session for API key lookup (required for Community Edition when use_llm=True)
         
     Returns:
-        PDF as bytes
+        (pdf_bytes, llm_complete): llm_complete is True only when both LLM stages produced
+        their output; fallback briefs are degraded and should not be cached as final
     """
-    logger.info(f"[local_pdf_generator] Generating PDF for session {session_id} (use_llm={use_llm}, user_id={user_id[:8] if user_id else None}...)")
+    logger.info("[local_pdf_generator] Generating PDF for session %s (use_llm=%s, user_id=%.8s...)", session_id, use_llm, user_id)
     
     # Step 1: Extract debate content
     logger.info("[local_pdf_generator] Step 1: Extracting debate content...")
     debate_content = extract_debate_content(session_json)
-    logger.info(f"[local_pdf_generator] Extracted: question='{debate_content['question'][:50]}...', confidence={debate_content['confidence']}%")
+    logger.info("[local_pdf_generator] Extracted: question='%.50s...', confidence=%s%%", debate_content['question'], debate_content['confidence'])
     
-    if use_llm:
-        # Step 2: Stage 1 - Generate structured brief
-        structured_brief = await generate_structured_brief(debate_content, user_id=user_id, db=db)
-        
-        # Step 3: Stage 2 - Render HTML from structured brief
-        html_content = await render_brief_html(structured_brief, debate_content, user_id=user_id, db=db)
-    else:
-        # Fallback: Generate basic HTML without LLM
-        structured_brief = {
-            "recommendation": "Review the expert positions and take action based on the analysis.",
-            "executive_summary": debate_content.get("debate_content", "Analysis complete.")[:1000],
-            "confidence_level": debate_content.get("confidence", 75),
-            "rationale": [],
-            "immediate_actions": [],
-        }
-        html_content = generate_fallback_html(structured_brief, debate_content)
+    # Launch the shared browser now so a cold launch overlaps the LLM stages. The context
+    # and page are opened inside the render slot, so only bounded renders hold pages
+    # (the Windows path renders on its own worker threads)
+    browser_task: Optional[asyncio.Task] = None
+    if platform.system() != "Windows":
+        browser_task = asyncio.create_task(browser_pool.get_browser())
+    
+    try:
+        if use_llm:
+            # Step 2: Stage 1 - Generate structured brief
+            structured_brief, stage1_ok = await generate_structured_brief(debate_content, user_id=user_id, db=db)
+            
+            # Step 3: Stage 2 - Render HTML from structured brief
+            html_content, stage2_ok = await render_brief_html(structured_brief, debate_content, user_id=user_id, db=db)
+            llm_complete = stage1_ok and stage2_ok
+        else:
+            # Fallback: Generate basic HTML without LLM
+            structured_brief = {
+                "recommendation": "Review the expert positions and take action based on the analysis.",
+                "executive_summary": debate_content.get("debate_content", "Analysis complete.")[:1000],
+                "confidence_level": debate_content.get("confidence", 75),
+                "rationale": [],
+                "immediate_actions": [],
+            }
+            html_content = generate_fallback_html(structured_brief, debate_content)
+            llm_complete = False
+    except BaseException:
+        if browser_task is not None:
+            await _discard_browser_task(browser_task)
+        raise
     
     # Step 4: Convert HTML to PDF using Playwright
     logger.info("[local_pdf_generator] Step 4: Converting HTML to PDF using Playwright...")
@@ -1089,114 +1301,64 @@ async def generate_pdf_from_session_json(
     # The default SelectorEventLoop on Windows doesn't support subprocess creation
     # which Playwright needs. Running sync Playwright in a thread avoids this.
     if platform.system() == "Windows":
-        def run_playwright_sync(html_content: str, session_id: str) -> bytes:
-            """Run Playwright synchronously in a thread to avoid Windows subprocess issues."""
-            from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-accelerated-2d-canvas',
-                        '--no-first-run',
-                        '--no-zygote',
-                        '--disable-gpu',
-                    ],
-                )
-                try:
-                    page = browser.new_page()
-                    page.set_content(html_content, wait_until="networkidle")
-                    
-                    # Format date for footer
-                    date = datetime.now().strftime("%Y.%m.%d")
-                    
-                    # Generate PDF with footer
-                    pdf_bytes = page.pdf(
-                        format="A4",
-                        margin={
-                            "top": "0.5in",
-                            "right": "0.5in",
-                            "bottom": "0.8in",
-                            "left": "0.5in",
-                        },
-                        print_background=True,
-                        display_header_footer=True,
-                        header_template="<div></div>",
-                        footer_template=f"""
-                            <div style="font-size: 10px; color: #888; width: 100%; display: flex; justify-content: space-between; align-items: center; padding: 0 20mm; border-top: 1px solid #e2e8f0; padding-top: 8px;">
-                                <span style="flex: 1; text-align: left;">{date}</span>
-                                <span style="flex: 1; text-align: right;">Page <span class="pageNumber"></span></span>
-                            </div>
-                        """,
-                    )
-                    return pdf_bytes
-                finally:
-                    browser.close()
+        def render_pdf(context) -> bytes:
+            """Render on a pooled sync browser (avoids Windows subprocess issues)."""
+            page = context.new_page()
+            page.emulate_media(media="print")
+            page.set_content(html_content, wait_until="load")
+            page.add_style_tag(path=BRIEF_CSS_PATH)
+            page.evaluate(browser_pool.FONTS_READY_SCRIPT)
+            
+            # Format date for footer
+            date = datetime.now().strftime("%Y.%m.%d")
+            
+            # Generate PDF with footer
+            return page.pdf(
+                **_PDF_OPTIONS,
+                footer_template=_PDF_FOOTER_TEMPLATE.format(date=date),
+            )
         
-        # Run Playwright in a thread to avoid Windows subprocess issues
+        # Run Playwright on a browser worker thread to avoid Windows subprocess issues
         logger.info("[local_pdf_generator] Running Playwright in thread (Windows workaround)")
         try:
-            pdf_bytes = await asyncio.to_thread(run_playwright_sync, html_content, session_id)
-            logger.info(f"[local_pdf_generator] PDF generated successfully, size: {len(pdf_bytes)} bytes")
-            return pdf_bytes
+            pdf_bytes = await browser_pool.run_sync(render_pdf)
+            logger.info("[local_pdf_generator] PDF generated successfully, size: %d bytes", len(pdf_bytes))
+            return pdf_bytes, llm_complete
         except Exception as e:
             logger.error(f"[local_pdf_generator] Error generating PDF on Windows: {e}", exc_info=True)
             raise Exception(f"PDF generation failed: {e}")
     
-    # Non-Windows: Use async Playwright (works with default event loop)
-    browser = None
+    # Non-Windows: Use async Playwright on the shared, pre-warmed browser
+    assert browser_task is not None  # started above on every non-Windows platform
+    context = None
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--disable-gpu',
-                ],
-            )
-            page = await browser.new_page()
-            await page.set_content(html_content, wait_until="networkidle")
+        await browser_task
+        # Only the Chromium work is bounded; the LLM stages above run unthrottled
+        async with browser_pool.render_slot():
+            context, page = await _open_render_page()
+            await page.set_content(html_content, wait_until="load")
+            await page.add_style_tag(path=BRIEF_CSS_PATH)
+            await page.evaluate(browser_pool.FONTS_READY_SCRIPT)
             
             # Format date for footer (same as frontend)
             date = datetime.now().strftime("%Y.%m.%d")
             
             # Generate PDF with footer (matches frontend htmlToPdf.ts)
             pdf_bytes = await page.pdf(
-                format="A4",
-                margin={
-                    "top": "0.5in",
-                    "right": "0.5in",
-                    "bottom": "0.8in",  # Extra for footer
-                    "left": "0.5in",
-                },
-                print_background=True,
-                display_header_footer=True,
-                header_template="<div></div>",  # Empty header
-                footer_template=f"""
-                    <div style="font-size: 10px; color: #888; width: 100%; display: flex; justify-content: space-between; align-items: center; padding: 0 20mm; border-top: 1px solid #e2e8f0; padding-top: 8px;">
-                        <span style="flex: 1; text-align: left;">{date}</span>
-                        <span style="flex: 1; text-align: right;">Page <span class="pageNumber"></span></span>
-                    </div>
-                """,
+                **_PDF_OPTIONS,
+                footer_template=_PDF_FOOTER_TEMPLATE.format(date=date),
             )
-            
-            await browser.close()
-            
-            logger.info(f"[local_pdf_generator] PDF generated successfully, size: {len(pdf_bytes)} bytes")
-            return pdf_bytes
+        
+        logger.info("[local_pdf_generator] PDF generated successfully, size: %d bytes", len(pdf_bytes))
+        return pdf_bytes, llm_complete
             
     except Exception as e:
         logger.error(f"[local_pdf_generator] Error generating PDF: {e}", exc_info=True)
-        if browser:
+        raise Exception(f"PDF generation failed: {e}")
+    finally:
+        # Only the context is per-request; the browser stays up for the next PDF
+        if context:
             try:
-                await browser.close()
-            except:
+                await context.close()
+            except Exception:
                 pass
-        raise Exception(f"PDF generation failed: {e}")
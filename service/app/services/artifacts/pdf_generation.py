@@ -1,20 +1,31 @@
 """PDF generation service for debate artifacts."""
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
-import tempfile
-from pathlib import Path
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.session import RoundtableSession
-from app.services.artifacts.s3_upload import read_json_from_s3, upload_pdf_to_s3_async
+from app.services.artifacts.s3_upload import find_existing_pdf_async, read_json_from_s3, upload_pdf_bytes_to_s3_async
 from app.services.artifacts.local_pdf_generator import generate_pdf_from_session_json
 
 logger = logging.getLogger(__name__)
 
+# (session_id, session JSON sha256) -> PDF URI for PDFs generated by this process
+_PDF_URI_CACHE_MAX_ENTRIES = 128
+_pdf_uri_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+
+def _remember_pdf_uri(cache_key: Tuple[str, str], uri: str) -> None:
+    _pdf_uri_cache[cache_key] = uri
+    _pdf_uri_cache.move_to_end(cache_key)
+    while len(_pdf_uri_cache) > _PDF_URI_CACHE_MAX_ENTRIES:
+        _pdf_uri_cache.popitem(last=False)
+
 
 async def generate_and_upload_pdf(
     session_id: str,
@@ -28,7 +39,7 @@ async def generate_and_upload_pdf(
     This function:
     1. Reads session JSON from S3 (using audit_log_uri)
     2. Generates PDF locally using Playwright
-    3. Uploads PDF to S3
+    3. Uploads the PDF bytes to S3
     4. Returns S3 URI for the PDF
     
     Args:
@@ -43,42 +54,50 @@ async def generate_and_upload_pdf(
     Raises:
         Exception: If PDF generation fails and raise_on_error is True
     """
+    user_id = str(session.user_id)
     try:
         # 1. Get session JSON from S3 (stored in audit_log_uri)
         if not session.audit_log_uri:
             logger.warning(f"[pdf_generation] No audit_log_uri found for session {session_id}, cannot generate PDF")
             return None
         
-        logger.info(f"[pdf_generation] Reading JSON from S3: {session.audit_log_uri}")
+        logger.info("[pdf_generation] Reading JSON from S3: %s", session.audit_log_uri)
         json_bytes = read_json_from_s3(session.audit_log_uri)
-        session_json = json.loads(json_bytes.decode("utf-8"))
+        
+        # Same session JSON -> same PDF: reuse an existing render instead of rerunning
+        # both LLM stages and Playwright (retries, repeated UI requests)
+        source_sha256 = hashlib.sha256(json_bytes).hexdigest()
+        cache_key = (session_id, source_sha256)
+        cached_uri = _pdf_uri_cache.get(cache_key) or await find_existing_pdf_async(session_id, source_sha256)
+        if cached_uri:
+            logger.info("[pdf_generation] Reusing PDF for unchanged session %s: %s", session_id, cached_uri)
+            _remember_pdf_uri(cache_key, cached_uri)
+            return cached_uri
+        
+        session_json = orjson.loads(json_bytes)
         
         # 2. Generate PDF locally using Playwright (pass user_id and db for API key resolution)
-        logger.info(f"[pdf_generation] Generating PDF locally for session {session_id} (user_id={str(session.user_id)[:8]}...)")
-        pdf_bytes = await generate_pdf_from_session_json(
+        logger.info("[pdf_generation] Generating PDF locally for session %s (user_id=%.8s...)", session_id, user_id)
+        pdf_bytes, llm_complete = await generate_pdf_from_session_json(
             session_id, 
             session_json, 
             use_llm=True,
-            user_id=str(session.user_id),  # Pass user_id for API key resolution
+            user_id=user_id,  # Pass user_id for API key resolution
             db=db  # Pass db session for API key lookup
         )
-        logger.info(f"[pdf_generation] PDF generated successfully, size: {len(pdf_bytes)} bytes")
-        
-        # 3. Save to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(pdf_bytes)
-            tmp_path = Path(tmp.name)
+        logger.info("[pdf_generation] PDF generated successfully, size: %d bytes", len(pdf_bytes))
         
-        try:
-            # 4. Upload to S3
-            logger.info(f"[pdf_generation] Uploading PDF to S3 for session {session_id}")
-            s3_uri = await upload_pdf_to_s3_async(tmp_path, session_id)
-            logger.info(f"[pdf_generation] PDF uploaded to S3: {s3_uri}")
-            return s3_uri
-        finally:
-            # 5. Clean up temp file
-            tmp_path.unlink(missing_ok=True)
-            logger.debug(f"[pdf_generation] Cleaned up temp file: {tmp_path}")
+        # 3. Upload to S3 straight from memory. A fallback brief (an LLM stage failed) is
+        # uploaded without the source hash so the next request regenerates it instead of
+        # reusing the degraded PDF for this transcript forever.
+        logger.info("[pdf_generation] Uploading PDF to S3 for session %s", session_id)
+        if not llm_complete:
+            logger.warning("[pdf_generation] PDF for session %s used a fallback brief; not caching it", session_id)
+        s3_uri = await upload_pdf_bytes_to_s3_async(pdf_bytes, session_id, source_sha256 if llm_complete else None)
+        logger.info("[pdf_generation] PDF uploaded to S3: %s", s3_uri)
+        if llm_complete:
+            _remember_pdf_uri(cache_key, s3_uri)
+        return s3_uri
     
     except Exception as e:
         logger.error(f"[pdf_generation] Error generating PDF for session {session_id}: {e}", exc_info=True)
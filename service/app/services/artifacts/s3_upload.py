@@ -8,30 +8,265 @@ When S3 is not configured, files are saved to LOCAL_ARTIFACTS_PATH (/data/artifa
 from __future__ import annotations
 
 import asyncio
+import errno
+import io
 import logging
 import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
-from urllib.parse import urlparse
+from typing import Any, BinaryIO, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
     from botocore.exceptions import BotoCoreError, ClientError
     BOTO3_AVAILABLE = True
 except ImportError:
     BotoCoreError = ClientError = Exception
     BOTO3_AVAILABLE = False
 
+# Artifact bucket, resolved once at import; None means local storage (Community Edition)
+S3_BUCKET = os.getenv("S3_ARTIFACTS_BUCKET") or os.getenv("AWS_S3_BUCKET") or None
+
 # Local artifacts path for Community Edition (no S3)
 LOCAL_ARTIFACTS_PATH = Path(os.getenv("ARTIFACTS_PATH", "/data/artifacts"))
 
+# Read size for streamed artifact downloads (see stream_artifact_from_s3)
+ARTIFACT_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Artifact filenames (local storage) and S3 keys per session, built with a bound str.format
+_JSON_FILENAME = "{}_debate_output.json".format
+_JSON_S3_KEY = "debate-outputs/{}_debate_output.json".format
+_PDF_FILENAME = "{}_executive_brief.pdf".format
+_PDF_S3_KEY = "debate-outputs/{}_executive_brief.pdf".format
+_PDF_SOURCE_HASH_FILENAME = "{}.sha256".format
+
+# SHA-256 of the session JSON a PDF was rendered from. Stored as S3 object metadata, or
+# in a hidden directory for local storage (kept out of the file explorer listing).
+PDF_SOURCE_HASH_METADATA_KEY = "source-sha256"
+LOCAL_PDF_SOURCE_HASH_DIR = LOCAL_ARTIFACTS_PATH / ".pdf_sources"
+
+# String form of LOCAL_ARTIFACTS_PATH for the save hot path: destinations are joined as
+# plain strings and handed straight to the syscalls, without a Path round trip per write
+_LOCAL_ARTIFACTS_DIR = os.fspath(LOCAL_ARTIFACTS_PATH)
+
+
+# Multipart settings for artifact uploads: 16 MB parts, up to 10 in flight; the client pool
+# below has room for all 10 part uploads. Anything under the threshold skips the transfer
+# manager entirely and goes up with a single put_object (see _upload_path / _upload_bytes).
+_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+_TRANSFER_CONFIG = (
+    TransferConfig(
+        multipart_threshold=_MULTIPART_THRESHOLD,
+        multipart_chunksize=16 * 1024 * 1024,
+        max_concurrency=10,
+        use_threads=True,
+    )
+    if BOTO3_AVAILABLE
+    else None
+)
+
+# One client per process: construction loads the botocore service model and a fresh
+# connection pool, so reusing it keeps TLS connections alive between artifact calls.
+# boto3 clients are thread-safe, which the async wrappers' worker threads rely on.
+_S3_CLIENT: Any | None = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+
+def _get_s3_client() -> Any:
+    """Return the shared S3 client, creating it on first use (requires boto3)."""
+    global _S3_CLIENT
+    if _S3_CLIENT is not None:
+        return _S3_CLIENT
+    with _S3_CLIENT_LOCK:
+        if _S3_CLIENT is None:
+            _S3_CLIENT = boto3.client(
+                "s3",
+                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                region_name=os.getenv("AWS_REGION", "us-east-1"),
+                config=BotoConfig(
+                    max_pool_connections=50,
+                    # SO_KEEPALIVE keeps idle pooled connections from being silently
+                    # reaped, so later calls don't pay a fresh TLS handshake
+                    tcp_keepalive=True,
+                    connect_timeout=3,
+                    read_timeout=30,
+                    retries={"mode": "adaptive", "max_attempts": 5},
+                ),
+            )
+        return _S3_CLIENT
+
+
+# Worker threads for the *_async wrappers. Kept apart from the default executor so a burst
+# of artifact uploads (each blocking for a full S3 round trip) can't starve other
+# asyncio.to_thread users, and vice versa. Stays below the client's connection pool size.
+S3_IO_WORKERS = int(os.getenv("S3_IO_WORKERS", "16"))
+_S3_IO_EXECUTOR = ThreadPoolExecutor(max_workers=S3_IO_WORKERS, thread_name_prefix="s3-io")
 
-def _is_s3_configured() -> bool:
-    """Check if S3 is configured."""
-    return bool(os.getenv("S3_ARTIFACTS_BUCKET") or os.getenv("AWS_S3_BUCKET"))
+
+async def _run_s3_io(fn: Callable[..., T], *args: Any) -> T:
+    """Run a blocking storage call on the S3 I/O executor."""
+    return await asyncio.get_running_loop().run_in_executor(_S3_IO_EXECUTOR, fn, *args)
+
+
+def _parse_s3_uri(uri: str) -> tuple[str, str]:
+    """Split an s3://bucket/key URI into (bucket, key); either may be empty if malformed."""
+    bucket, _, key = uri[5:].partition("/")
+    return bucket, key.lstrip("/")
+
+
+def _require_boto3() -> None:
+    if not BOTO3_AVAILABLE:
+        raise ImportError("boto3 is not installed. Install with: pip install boto3")
+
+
+def _resolve_s3_uri(uri: str, example_path: str) -> tuple[str, str]:
+    """Validate an s3:// URI (and that boto3 is available) and return (bucket, key)."""
+    if not uri.startswith("s3://"):
+        raise ValueError(f"Invalid URI format: {uri}. Expected s3:// or file:// URI")
+    
+    _require_boto3()
+    
+    bucket, key = _parse_s3_uri(uri)
+    if not bucket or not key:
+        raise ValueError(f"Invalid S3 URI format: {uri}. Expected s3://bucket-name/{example_path}")
+    return bucket, key
+
+
+def _s3_error(e: Exception, action: str, bucket: str, key: str) -> Exception:
+    """Translate a boto error: a missing object becomes FileNotFoundError, the rest a detailed Exception."""
+    error_code = e.response.get("Error", {}).get("Code", "Unknown") if hasattr(e, "response") else "Unknown"
+    if error_code == "404" or error_code == "NoSuchKey":
+        return FileNotFoundError(f"S3 object not found: s3://{bucket}/{key}")
+    error_message = e.response.get("Error", {}).get("Message", str(e)) if hasattr(e, "response") else str(e)
+    return Exception(f"Failed to {action} S3 (Error: {error_code}): {error_message}")
+
+
+def _open_s3_body(bucket: str, key: str) -> Any:
+    """get_object and return its streaming body (no head_object: get_object reports NoSuchKey itself)."""
+    try:
+        response = _get_s3_client().get_object(Bucket=bucket, Key=key)
+    except (BotoCoreError, ClientError) as e:
+        raise _s3_error(e, "read from", bucket, key) from e
+    body = response.get("Body")
+    if body is None:
+        raise Exception(f"S3 object has no body: s3://{bucket}/{key}")
+    return body
+
+
+def _read_s3_object(uri: str, example_path: str) -> bytes:
+    bucket, key = _resolve_s3_uri(uri, example_path)
+    body = _open_s3_body(bucket, key)
+    try:
+        return body.read()
+    except (BotoCoreError, ClientError) as e:
+        raise _s3_error(e, "read from", bucket, key) from e
+
+
+def _upload_path(s3_client: Any, path: Path, bucket: str, key: str, extra_args: dict[str, Any]) -> None:
+    """Upload a file: put_object for small files, the threaded transfer manager for large ones."""
+    size = os.path.getsize(path)
+    if size >= _MULTIPART_THRESHOLD:
+        s3_client.upload_file(str(path), bucket, key, ExtraArgs=extra_args, Config=_TRANSFER_CONFIG)
+        return
+    with open(path, "rb") as body:
+        s3_client.put_object(Bucket=bucket, Key=key, Body=body, ContentLength=size, **extra_args)
+
+
+def _upload_bytes(s3_client: Any, data: bytes, bucket: str, key: str, extra_args: dict[str, Any]) -> None:
+    """In-memory counterpart of _upload_path."""
+    if len(data) >= _MULTIPART_THRESHOLD:
+        s3_client.upload_fileobj(io.BytesIO(data), bucket, key, ExtraArgs=extra_args, Config=_TRANSFER_CONFIG)
+        return
+    s3_client.put_object(Bucket=bucket, Key=key, Body=data, **extra_args)
+
+
+def _pdf_upload_extra_args(source_sha256: str | None) -> dict[str, Any]:
+    extra_args: dict[str, Any] = {"ContentType": "application/pdf"}
+    if source_sha256:
+        extra_args["Metadata"] = {PDF_SOURCE_HASH_METADATA_KEY: source_sha256}
+    return extra_args
+
+
+def _write_in_local_dir(directory: Path, write: Callable[[], T]) -> T:
+    """
+    Run write(), creating directory and retrying once if it is missing.
+    
+    The directory exists for every write after the first (or after something removes
+    it), so this skips the mkdir syscalls an up-front mkdir(exist_ok=True) costs per call.
+    """
+    try:
+        return write()
+    except FileNotFoundError:
+        directory.mkdir(parents=True, exist_ok=True)
+        return write()
+
+
+def _save_local_pdf_source_hash(session_id: str, source_sha256: str | None) -> None:
+    hash_path = LOCAL_PDF_SOURCE_HASH_DIR / _PDF_SOURCE_HASH_FILENAME(session_id)
+    if source_sha256:
+        _write_in_local_dir(LOCAL_PDF_SOURCE_HASH_DIR, lambda: hash_path.write_text(source_sha256))
+    else:
+        # The PDF is being replaced by one that must not be reused; forget the old hash
+        hash_path.unlink(missing_ok=True)
+
+
+# Local reads at least this large ask the kernel for aggressive readahead
+_SEQUENTIAL_READ_HINT_BYTES = 64 * 1024 * 1024
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """Best-effort posix_fadvise over the whole file; a no-op where unsupported (macOS, Windows)."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice_name))
+        except OSError:
+            pass
+
+
+# copy_file_range errors meaning "not possible here" rather than a real I/O failure
+_COPY_FILE_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+
+
+def _copy_file(source_path: str | Path, dest_path: str | Path) -> None:
+    """
+    Copy a file and its metadata like shutil.copy2, preferring os.copy_file_range.
+    
+    copy_file_range keeps the copy in the kernel and lets filesystems that support it
+    (btrfs, XFS, NFS) reflink or copy server-side. Where it is unavailable or refused,
+    shutil.copy2 takes over (sendfile on Linux, fcopyfile on macOS).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+                src_fd, dst_fd = src.fileno(), dst.fileno()
+                _fadvise(src_fd, "POSIX_FADV_SEQUENTIAL")
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        # Stopped early (source shrank, or the filesystem gave up partway):
+                        # finish from the current offsets in userspace rather than truncate
+                        shutil.copyfileobj(src, dst)
+                        break
+                    remaining -= copied
+                # The source (a freshly exported artifact) won't be read again soon;
+                # drop its pages rather than evict hotter ones
+                _fadvise(src_fd, "POSIX_FADV_DONTNEED")
+            shutil.copystat(source_path, dest_path)
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+    shutil.copy2(source_path, dest_path)
 
 
 def _save_to_local(source_path: Path, filename: str, content_type: str = "application/json") -> str:
@@ -46,16 +281,42 @@ def _save_to_local(source_path: Path, filename: str, content_type: str = "applic
     Returns:
         Local file URI in format: file:///data/artifacts/filename
     """
-    # Ensure artifacts directory exists
-    LOCAL_ARTIFACTS_PATH.mkdir(parents=True, exist_ok=True)
+    dest_path = os.path.join(_LOCAL_ARTIFACTS_DIR, filename)
+    _write_in_local_dir(LOCAL_ARTIFACTS_PATH, lambda: _copy_file(source_path, dest_path))
     
-    dest_path = LOCAL_ARTIFACTS_PATH / filename
-    shutil.copy2(source_path, dest_path)
+    logger.info("[artifacts] Saved %s to local storage: %s", content_type, dest_path)
+    return f"file://{dest_path}"
+
+
+def _save_bytes_to_local(data: bytes, filename: str, content_type: str = "application/json") -> str:
+    """
+    Write in-memory content to the local artifacts directory.
+    
+    Args:
+        data: File contents
+        filename: Filename for the saved file
+        content_type: MIME type (for logging purposes)
+    
+    Returns:
+        Local file URI in format: file:///data/artifacts/filename
+    """
+    dest_path = os.path.join(_LOCAL_ARTIFACTS_DIR, filename)
+    
+    def write() -> None:
+        with open(dest_path, "wb") as f:
+            f.write(data)
+    
+    _write_in_local_dir(LOCAL_ARTIFACTS_PATH, write)
     
-    logger.info(f"[artifacts] Saved {content_type} to local storage: {dest_path}")
+    logger.info("[artifacts] Saved %s to local storage: %s", content_type, dest_path)
     return f"file://{dest_path}"
 
 
+def _local_path_from_uri(uri: str) -> str:
+    """Filesystem path for a file:// URI (or a bare legacy path), as a plain string."""
+    return uri[7:] if uri.startswith("file://") else uri
+
+
 def _read_from_local(file_uri: str) -> bytes:
     """
     Read file from local artifacts directory.
@@ -66,16 +327,17 @@ def _read_from_local(file_uri: str) -> bytes:
     Returns:
         File contents as bytes
     """
-    # Parse file:// URI
-    if file_uri.startswith("file://"):
-        file_path = Path(file_uri[7:])  # Remove "file://" prefix
-    else:
-        file_path = Path(file_uri)
+    file_path = _local_path_from_uri(file_uri)
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"Local file not found: {file_path}")
-    
-    return file_path.read_bytes()
+    # Unbuffered FileIO.readall sizes its buffer from fstat and fills it in one pass;
+    # opening directly (rather than exists() first) also saves a stat call
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            if os.fstat(f.fileno()).st_size >= _SEQUENTIAL_READ_HINT_BYTES:
+                _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+            return f.readall()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Local file not found: {file_path}") from e
 
 
 def _delete_from_local(file_uri: str) -> bool:
@@ -88,17 +350,16 @@ def _delete_from_local(file_uri: str) -> bool:
     Returns:
         True if deletion succeeded
     """
-    # Parse file:// URI
-    if file_uri.startswith("file://"):
-        file_path = Path(file_uri[7:])  # Remove "file://" prefix
-    else:
-        file_path = Path(file_uri)
+    file_path = _local_path_from_uri(file_uri)
     
-    if file_path.exists():
-        file_path.unlink()
-        logger.info(f"[artifacts] Deleted local file: {file_path}")
-        return True
-    return False
+    # EAFP: one unlink syscall instead of stat + unlink; a missing file is not an error,
+    # matching S3's idempotent delete_object
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        return False
+    logger.info("[artifacts] Deleted local file: %s", file_path)
+    return True
 
 
 def upload_json_to_s3(json_path: Path, session_id: str) -> str:
@@ -120,37 +381,23 @@ def upload_json_to_s3(json_path: Path, session_id: str) -> str:
     if not json_path.exists():
         raise FileNotFoundError(f"JSON file not found: {json_path}")
     
-    # Check if S3 is configured
-    bucket_name = os.getenv("S3_ARTIFACTS_BUCKET") or os.getenv("AWS_S3_BUCKET")
+    bucket_name = S3_BUCKET
     
     # If S3 not configured, save locally (Community Edition)
     if not bucket_name:
-        filename = f"{session_id}_debate_output.json"
-        return _save_to_local(json_path, filename, "application/json")
+        return _save_to_local(json_path, _JSON_FILENAME(session_id), "application/json")
     
     # S3 upload path
-    if not BOTO3_AVAILABLE:
-        raise ImportError("boto3 is not installed. Install with: pip install boto3")
+    _require_boto3()
     
     # Construct S3 key
-    s3_key = f"debate-outputs/{session_id}_debate_output.json"
-    
-    # Initialize S3 client
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-        region_name=os.getenv("AWS_REGION", "us-east-1"),
-    )
+    s3_key = _JSON_S3_KEY(session_id)
+    
+    s3_client = _get_s3_client()
     
     try:
         # Upload file
-        s3_client.upload_file(
-            str(json_path),
-            bucket_name,
-            s3_key,
-            ExtraArgs={"ContentType": "application/json"},
-        )
+        _upload_path(s3_client, json_path, bucket_name, s3_key, {"ContentType": "application/json"})
         
         # Return S3 URI
         s3_uri = f"s3://{bucket_name}/{s3_key}"
@@ -176,7 +423,7 @@ async def upload_json_to_s3_async(json_path: Path, session_id: str) -> str:
     Raises:
         Exception: If S3 upload fails or boto3 is not available
     """
-    return await asyncio.to_thread(upload_json_to_s3, json_path, session_id)
+    return await _run_s3_io(upload_json_to_s3, json_path, session_id)
 
 
 def read_json_from_s3(uri: str) -> bytes:
@@ -201,47 +448,7 @@ def read_json_from_s3(uri: str) -> bytes:
     if uri.startswith("file://"):
         return _read_from_local(uri)
     
-    # Handle S3 URIs
-    if not uri.startswith("s3://"):
-        raise ValueError(f"Invalid URI format: {uri}. Expected s3:// or file:// URI")
-    
-    if not BOTO3_AVAILABLE:
-        raise ImportError("boto3 is not installed. Install with: pip install boto3")
-    
-    parsed = urlparse(uri)
-    bucket = parsed.netloc
-    key = parsed.path.lstrip("/")
-    
-    if not bucket or not key:
-        raise ValueError(f"Invalid S3 URI format: {uri}. Expected s3://bucket-name/path/to/file.json")
-    
-    try:
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=os.getenv("AWS_REGION", "us-east-1"),
-        )
-        
-        # First check if object exists
-        try:
-            s3_client.head_object(Bucket=bucket, Key=key)
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            if error_code == "404" or error_code == "NoSuchKey":
-                raise FileNotFoundError(f"S3 object not found: s3://{bucket}/{key}") from e
-            raise Exception(f"Failed to check S3 object existence: {e}") from e
-        
-        # Read the object
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        body = response.get("Body")
-        if body is None:
-            raise Exception(f"S3 object has no body: s3://{bucket}/{key}")
-        return body.read()
-    except (BotoCoreError, ClientError) as e:
-        error_code = e.response.get("Error", {}).get("Code", "Unknown") if hasattr(e, "response") else "Unknown"
-        error_message = e.response.get("Error", {}).get("Message", str(e)) if hasattr(e, "response") else str(e)
-        raise Exception(f"Failed to read from S3 (Error: {error_code}): {error_message}") from e
+    return _read_s3_object(uri, "path/to/file.json")
 
 
 def delete_json_from_s3(uri: str) -> bool:
@@ -263,35 +470,13 @@ def delete_json_from_s3(uri: str) -> bool:
     if uri.startswith("file://"):
         return _delete_from_local(uri)
     
-    # Handle S3 URIs
-    if not uri.startswith("s3://"):
-        raise ValueError(f"Invalid URI format: {uri}. Expected s3:// or file:// URI")
-    
-    if not BOTO3_AVAILABLE:
-        raise ImportError("boto3 is not installed. Install with: pip install boto3")
-    
-    parsed = urlparse(uri)
-    bucket = parsed.netloc
-    key = parsed.path.lstrip("/")
-    
-    if not bucket or not key:
-        raise ValueError(f"Invalid S3 URI format: {uri}. Expected s3://bucket-name/path/to/file.json")
+    bucket, key = _resolve_s3_uri(uri, "path/to/file.json")
     
     try:
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=os.getenv("AWS_REGION", "us-east-1"),
-        )
-        
-        # Delete the object
-        s3_client.delete_object(Bucket=bucket, Key=key)
+        _get_s3_client().delete_object(Bucket=bucket, Key=key)
         return True
     except (BotoCoreError, ClientError) as e:
-        error_code = e.response.get("Error", {}).get("Code", "Unknown") if hasattr(e, "response") else "Unknown"
-        error_message = e.response.get("Error", {}).get("Message", str(e)) if hasattr(e, "response") else str(e)
-        raise Exception(f"Failed to delete from S3 (Error: {error_code}): {error_message}") from e
+        raise _s3_error(e, "delete from", bucket, key) from e
 
 
 async def delete_json_from_s3_async(s3_uri: str) -> bool:
@@ -309,10 +494,10 @@ async def delete_json_from_s3_async(s3_uri: str) -> bool:
     Raises:
         Exception: If S3 deletion fails
     """
-    return await asyncio.to_thread(delete_json_from_s3, s3_uri)
+    return await _run_s3_io(delete_json_from_s3, s3_uri)
 
 
-def upload_pdf_to_s3(pdf_path: Path, session_id: str) -> str:
+def upload_pdf_to_s3(pdf_path: Path, session_id: str, source_sha256: str | None = None) -> str:
     """
     Upload PDF file to S3 or local storage and return URI.
     
@@ -321,6 +506,7 @@ def upload_pdf_to_s3(pdf_path: Path, session_id: str) -> str:
     Args:
         pdf_path: Path to the PDF file to upload
         session_id: Session ID for constructing filename
+        source_sha256: Hash of the session JSON the PDF came from (see find_existing_pdf)
     
     Returns:
         URI in format: s3://bucket-name/path/to/file.pdf or file:///path/to/file.pdf
@@ -331,37 +517,27 @@ def upload_pdf_to_s3(pdf_path: Path, session_id: str) -> str:
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
     
-    # Check if S3 is configured
-    bucket_name = os.getenv("S3_ARTIFACTS_BUCKET") or os.getenv("AWS_S3_BUCKET")
+    bucket_name = S3_BUCKET
     
     # If S3 not configured, save locally (Community Edition)
     if not bucket_name:
-        filename = f"{session_id}_executive_brief.pdf"
-        return _save_to_local(pdf_path, filename, "application/pdf")
+        uri = _save_to_local(pdf_path, _PDF_FILENAME(session_id), "application/pdf")
+        _save_local_pdf_source_hash(session_id, source_sha256)
+        return uri
     
     # S3 upload path
-    if not BOTO3_AVAILABLE:
-        raise ImportError("boto3 is not installed. Install with: pip install boto3")
+    _require_boto3()
     
     # Construct S3 key
-    s3_key = f"debate-outputs/{session_id}_executive_brief.pdf"
-    
-    # Initialize S3 client
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-        region_name=os.getenv("AWS_REGION", "us-east-1"),
-    )
+    s3_key = _PDF_S3_KEY(session_id)
+    
+    s3_client = _get_s3_client()
+    
+    extra_args = _pdf_upload_extra_args(source_sha256)
     
     try:
         # Upload file
-        s3_client.upload_file(
-            str(pdf_path),
-            bucket_name,
-            s3_key,
-            ExtraArgs={"ContentType": "application/pdf"},
-        )
+        _upload_path(s3_client, pdf_path, bucket_name, s3_key, extra_args)
         
         # Return S3 URI
         s3_uri = f"s3://{bucket_name}/{s3_key}"
@@ -371,7 +547,7 @@ def upload_pdf_to_s3(pdf_path: Path, session_id: str) -> str:
         raise Exception(f"Failed to upload PDF to S3: {e}") from e
 
 
-async def upload_pdf_to_s3_async(pdf_path: Path, session_id: str) -> str:
+async def upload_pdf_to_s3_async(pdf_path: Path, session_id: str, source_sha256: str | None = None) -> str:
     """
     Async wrapper for upload_pdf_to_s3.
     
@@ -387,7 +563,98 @@ async def upload_pdf_to_s3_async(pdf_path: Path, session_id: str) -> str:
     Raises:
         Exception: If S3 upload fails or boto3 is not available
     """
-    return await asyncio.to_thread(upload_pdf_to_s3, pdf_path, session_id)
+    return await _run_s3_io(upload_pdf_to_s3, pdf_path, session_id, source_sha256)
+
+
+def upload_pdf_bytes_to_s3(pdf_bytes: bytes, session_id: str, source_sha256: str | None = None) -> str:
+    """
+    Upload in-memory PDF bytes to S3 or local storage and return URI.
+    
+    Same destination and metadata as upload_pdf_to_s3, without a temp file round trip.
+    
+    Args:
+        pdf_bytes: PDF contents
+        session_id: Session ID for constructing filename
+        source_sha256: Hash of the session JSON the PDF came from (see find_existing_pdf)
+    
+    Returns:
+        URI in format: s3://bucket-name/path/to/file.pdf or file:///path/to/file.pdf
+    
+    Raises:
+        Exception: If upload fails
+    """
+    bucket_name = S3_BUCKET
+    
+    # If S3 not configured, save locally (Community Edition)
+    if not bucket_name:
+        uri = _save_bytes_to_local(pdf_bytes, _PDF_FILENAME(session_id), "application/pdf")
+        _save_local_pdf_source_hash(session_id, source_sha256)
+        return uri
+    
+    _require_boto3()
+    
+    s3_key = _PDF_S3_KEY(session_id)
+    
+    s3_client = _get_s3_client()
+    
+    extra_args = _pdf_upload_extra_args(source_sha256)
+    
+    try:
+        _upload_bytes(s3_client, pdf_bytes, bucket_name, s3_key, extra_args)
+        return f"s3://{bucket_name}/{s3_key}"
+    except (BotoCoreError, ClientError) as e:
+        raise Exception(f"Failed to upload PDF to S3: {e}") from e
+
+
+async def upload_pdf_bytes_to_s3_async(pdf_bytes: bytes, session_id: str, source_sha256: str | None = None) -> str:
+    """Async wrapper for upload_pdf_bytes_to_s3 (runs in thread pool to avoid blocking)."""
+    return await _run_s3_io(upload_pdf_bytes_to_s3, pdf_bytes, session_id, source_sha256)
+
+
+def find_existing_pdf(session_id: str, source_sha256: str) -> str | None:
+    """
+    Return the URI of the session's PDF if it was rendered from the same session JSON.
+    
+    Lets repeated generation requests (retries, UI re-requests) skip the LLM and
+    Playwright pipeline. Lookup failures are treated as a miss.
+    
+    Args:
+        session_id: Session ID for constructing the PDF key/filename
+        source_sha256: SHA-256 of the session JSON about to be rendered
+    
+    Returns:
+        Existing PDF URI, or None if there is no PDF for this exact input
+    """
+    bucket_name = S3_BUCKET
+    
+    if not bucket_name:
+        hash_path = LOCAL_PDF_SOURCE_HASH_DIR / _PDF_SOURCE_HASH_FILENAME(session_id)
+        pdf_path = LOCAL_ARTIFACTS_PATH / _PDF_FILENAME(session_id)
+        try:
+            if pdf_path.is_file() and hash_path.read_text().strip() == source_sha256:
+                return f"file://{pdf_path}"
+        except OSError:
+            pass
+        return None
+    
+    if not BOTO3_AVAILABLE:
+        return None
+    
+    s3_key = _PDF_S3_KEY(session_id)
+    try:
+        s3_client = _get_s3_client()
+        head = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
+    except (BotoCoreError, ClientError):
+        return None
+    
+    if head.get("Metadata", {}).get(PDF_SOURCE_HASH_METADATA_KEY) == source_sha256:
+        return f"s3://{bucket_name}/{s3_key}"
+    return None
+
+
+async def find_existing_pdf_async(session_id: str, source_sha256: str) -> str | None:
+    """Async wrapper for find_existing_pdf (runs in thread pool to avoid blocking)."""
+    return await _run_s3_io(find_existing_pdf, session_id, source_sha256)
 
 
 def read_pdf_from_s3(uri: str) -> bytes:
@@ -412,45 +679,45 @@ def read_pdf_from_s3(uri: str) -> bytes:
     if uri.startswith("file://"):
         return _read_from_local(uri)
     
-    # Handle S3 URIs
-    if not uri.startswith("s3://"):
-        raise ValueError(f"Invalid URI format: {uri}. Expected s3:// or file:// URI")
+    return _read_s3_object(uri, "path/to/file.pdf")
+
+
+def _iter_chunks_and_close(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Yield chunk_size reads from stream until EOF, closing it even if iteration stops early."""
+    try:
+        while chunk := stream.read(chunk_size):
+            yield chunk
+    finally:
+        stream.close()
+
+
+def stream_artifact_from_s3(uri: str, chunk_size: int = ARTIFACT_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Open an artifact in S3 or local storage and return an iterator over its bytes.
     
-    if not BOTO3_AVAILABLE:
-        raise ImportError("boto3 is not installed. Install with: pip install boto3")
+    For downloads that pass the content straight through (e.g. StreamingResponse), so
+    the whole object never has to sit in memory. The object is opened eagerly, so a
+    missing artifact raises here rather than after the response has started.
     
-    parsed = urlparse(uri)
-    bucket = parsed.netloc
-    key = parsed.path.lstrip("/")
+    Args:
+        uri: URI in format s3://bucket-name/path/to/file or file:///path/to/file
+        chunk_size: Bytes per yielded chunk
     
-    if not bucket or not key:
-        raise ValueError(f"Invalid S3 URI format: {uri}. Expected s3://bucket-name/path/to/file.pdf")
+    Returns:
+        Iterator of byte chunks; closes the underlying stream when exhausted or closed
     
-    try:
-        s3_client = boto3.client(
-            "s3",
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=os.getenv("AWS_REGION", "us-east-1"),
-        )
-        
-        # First check if object exists
+    Raises:
+        ImportError: If boto3 is not installed (for S3 URIs)
+        ValueError: If URI format is invalid
+        FileNotFoundError: If object/file does not exist
+        Exception: If the read fails with detailed error message
+    """
+    if uri.startswith("file://"):
+        file_path = _local_path_from_uri(uri)
         try:
-            s3_client.head_object(Bucket=bucket, Key=key)
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            if error_code == "404" or error_code == "NoSuchKey":
-                raise FileNotFoundError(f"S3 object not found: s3://{bucket}/{key}") from e
-            raise Exception(f"Failed to check S3 object existence: {e}") from e
-        
-        # Read the object
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        body = response.get("Body")
-        if body is None:
-            raise Exception(f"S3 object has no body: s3://{bucket}/{key}")
-        return body.read()
-    except (BotoCoreError, ClientError) as e:
-        error_code = e.response.get("Error", {}).get("Code", "Unknown") if hasattr(e, "response") else "Unknown"
-        error_message = e.response.get("Error", {}).get("Message", str(e)) if hasattr(e, "response") else str(e)
-        raise Exception(f"Failed to read from S3 (Error: {error_code}): {error_message}") from e
-
+            return _iter_chunks_and_close(open(file_path, "rb"), chunk_size)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Local file not found: {file_path}") from e
+    
+    bucket, key = _resolve_s3_uri(uri, "path/to/file")
+    return _iter_chunks_and_close(_open_s3_body(bucket, key), chunk_size)
@@ -42,15 +42,8 @@ async def run_debate_background(
         logger.info(f"[background-debate] Topic: {topic[:100] if topic else 'None'}...")
         logger.info(f"[background-debate] User ID: {user_id}, Session DB ID: {session_db_id}")
         
-        # Verify database connection is healthy before starting
-        try:
-            await engine_db.execute(select(1))
-            logger.debug(f"[background-debate] Database connection verified")
-        except Exception as conn_error:
-            logger.error(f"[background-debate] ❌ Database connection check failed: {conn_error}", exc_info=True)
-            raise  # Re-raise to fail fast if DB is down
-        
-        # Fetch session and verify ownership
+        # Fetch session and verify ownership. This is also the first query on the connection,
+        # so a dead database fails fast here without a separate SELECT 1 round trip.
         result = await engine_db.execute(
             select(RoundtableSession)
             .options(selectinload(RoundtableSession.knights))
@@ -120,25 +113,21 @@ async def run_debate_background(
         
         # Resume: Hydrate state from existing events if any
         # Initialize before try block to ensure it's always defined in except handler
-        existing_events_models = []
+        existing_payloads = []
         try:
-            # Fetch all existing events ordered by sequence_id
-            events_result = await engine_db.execute(
-                select(SessionEvent)
+            # Fetch only the payload column of existing events, ordered by sequence_id
+            # (the ORM rows were only ever used for their payload)
+            payloads_result = await engine_db.execute(
+                select(SessionEvent.payload)
                 .where(SessionEvent.session_id == session_db_id)
                 .order_by(SessionEvent.sequence_id)
             )
-            existing_events_models = events_result.scalars().all()
+            existing_payloads = payloads_result.scalars().all()
             
-            if existing_events_models:
-                logger.info(f"[background-debate] Resuming debate with {len(existing_events_models)} existing events")
-                # Convert SessionEvent models to payloads
-                # The payload field in SessionEvent is already a dict/JSON
-                event_payloads = []
-                for evt in existing_events_models:
-                    # Ensure payload is dict
-                    p = evt.payload if isinstance(evt.payload, dict) else json.loads(evt.payload)
-                    event_payloads.append(p)
+            if existing_payloads:
+                logger.info(f"[background-debate] Resuming debate with {len(existing_payloads)} existing events")
+                # The JSON column already decodes to dicts; only legacy rows stored as strings need parsing
+                event_payloads = [p if isinstance(p, dict) else json.loads(p) for p in existing_payloads]
                 
                 # Pass knights count for validation
                 knights_count = len(engine_session.knights) if engine_session.knights else 0
@@ -148,10 +137,10 @@ async def run_debate_background(
             
             # CRITICAL: If session has existing events, we MUST restore state or fail
             # Proceeding without restoration will cause duplicate events and waste LLM calls
-            if existing_events_models:
+            if existing_payloads:
                 error_msg = (
                     f"CRITICAL: Cannot proceed without state restoration for session {session_id_str}. "
-                    f"Session has {len(existing_events_models)} existing events. "
+                    f"Session has {len(existing_payloads)} existing events. "
                     f"Restoration failed: {restore_error}"
                 )
                 logger.error(f"[background-debate] {error_msg}", exc_info=True)
@@ -195,6 +195,17 @@ class AnthropicProvider(BaseLLMProvider):
         # Get max_tokens from kwargs or use default
         max_tokens = kwargs.get("max_tokens", 4096)
         
+        # A static prefix goes in its own block marked for prompt caching, so repeat calls
+        # within the cache window reuse the prefix instead of re-processing it
+        cache_prefix = kwargs.pop("cache_prefix", None)
+        if cache_prefix:
+            content: Any = [
+                {"type": "text", "text": cache_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            content = prompt
+        
         try:
             # Build request parameters
             request_params = {
@@ -202,7 +213,7 @@ class AnthropicProvider(BaseLLMProvider):
                 "max_tokens": max_tokens,
                 "temperature": temperature,
                 "messages": [
-                    {"role": "user", "content": prompt}
+                    {"role": "user", "content": content}
                 ]
             }
             
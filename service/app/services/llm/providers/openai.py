@@ -100,6 +100,14 @@ class OpenAIProvider(BaseLLMProvider):
         if "plugins" in kwargs:
             kwargs.pop("plugins")
         
+        # Schema-constrained output takes precedence over plain JSON mode
+        json_schema = kwargs.pop("json_schema", None)
+        response_format: dict[str, Any] | None
+        if json_schema:
+            response_format = {"type": "json_schema", "json_schema": json_schema}
+        else:
+            response_format = {"type": "json_object"} if json_mode else None
+        
         try:
             # OpenAI supports web search via Responses API with tools parameter
             if web_search_enabled:
@@ -124,7 +132,7 @@ class OpenAIProvider(BaseLLMProvider):
                     model=model_to_use,
                     messages=[{"role": "user", "content": prompt}],
                     temperature=temperature,
-                    response_format={"type": "json_object"} if json_mode else None,
+                    response_format=response_format,
                     **kwargs
                 )
                 result = response.choices[0].message.content or ""
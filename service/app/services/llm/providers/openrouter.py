@@ -51,6 +51,25 @@ class OpenRouterProvider(BaseLLMProvider):
         
         extra_body = kwargs.get("extra_body", {})
         
+        # Schema-constrained output takes precedence over plain JSON mode
+        json_schema = kwargs.get("json_schema")
+        response_format: dict[str, Any] | None
+        if json_schema:
+            response_format = {"type": "json_schema", "json_schema": json_schema}
+        else:
+            response_format = {"type": "json_object"} if json_mode else None
+        
+        # Send a static prefix as its own content part with cache_control so OpenRouter
+        # enables prompt caching for providers that need it (e.g. Anthropic)
+        cache_prefix = kwargs.get("cache_prefix")
+        if cache_prefix:
+            content: Any = [
+                {"type": "text", "text": cache_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            content = prompt
+        
         # Handle plugins if passed directly in kwargs
         if "plugins" in kwargs:
             extra_body["plugins"] = kwargs["plugins"]
@@ -60,9 +79,9 @@ class OpenRouterProvider(BaseLLMProvider):
             logger.debug(f"[OpenRouterProvider.generate] Calling OpenRouter API...")
             response = await self.client.chat.completions.create(
                 model=model or self.default_model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=[{"role": "user", "content": content}],
                 temperature=temperature,
-                response_format={"type": "json_object"} if json_mode else None,
+                response_format=response_format,
                 extra_body=extra_body if extra_body else None,
                 extra_headers={
                     "HTTP-Referer": os.getenv("OPENROUTER_SITE_URL") or os.getenv("ROUNDTABLE_OPENROUTER_SITE_URL", "https://roundtable.ai"),
@@ -15,7 +15,7 @@
 
 """LLM Router for routing requests to appropriate providers."""
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -77,6 +77,12 @@ PROVIDER_MAP = {
     "Eden AI": "eden_ai",
 }
 
+# Providers that accept a cache_prefix kwarg and mark it for server-side prompt caching
+PROMPT_CACHE_PROVIDERS: frozenset[str] = frozenset({"anthropic", "openrouter"})
+
+# Providers that accept a json_schema kwarg for schema-constrained (structured) output
+STRUCTURED_OUTPUT_PROVIDERS: frozenset[str] = frozenset({"openai", "openrouter"})
+
 @dataclass
 class LLMRequest:
     prompt: str
@@ -86,6 +92,12 @@ class LLMRequest:
     temperature: float = 0.2
     json_mode: bool = False
     web_search: bool = False
+    # Static text sent ahead of prompt. Providers in PROMPT_CACHE_PROVIDERS send it as a
+    # separate block marked for prompt caching; others just receive cache_prefix + prompt.
+    cache_prefix: str | None = None
+    # OpenAI-style json_schema spec ({"name", "schema", "strict"}). Providers in
+    # STRUCTURED_OUTPUT_PROVIDERS constrain output to it; others fall back to json_mode.
+    json_schema: dict[str, Any] | None = None
     _provider_used: str | None = None  # Internal: track which provider was actually used
 
 class LLMRouter:
@@ -478,7 +490,8 @@ class LLMRouter:
                 logger.debug(f"[LLMRouter.generate] Web search enabled - using native provider web search capability")
         
         # Estimate tokens (rough: ~4 characters per token)
-        estimated_tokens = len(request.prompt) // 4 + 100  # Add buffer for response
+        prompt_length = len(request.prompt) + len(request.cache_prefix or "")
+        estimated_tokens = prompt_length // 4 + 100  # Add buffer for response
         
         last_error = None
         
@@ -570,14 +583,24 @@ class LLMRouter:
                 # Wrap LLM call with provider-specific circuit breaker
                 # This ensures failures in one provider don't block others
                 circuit_breaker = get_llm_circuit_breaker(provider_name)
-                logger.info(f"[LLMRouter] Calling provider.generate() - model: {provider_model}, prompt length: {len(request.prompt)}")
+                logger.info(f"[LLMRouter] Calling provider.generate() - model: {provider_model}, prompt length: {prompt_length}")
                 
                 # Pass database session to provider so native providers can look up native_api_identifier
-                provider_kwargs = {**kwargs, "db": db}
+                provider_kwargs: dict[str, Any] = {**kwargs, "db": db}
+                
+                if request.json_schema and provider_name in STRUCTURED_OUTPUT_PROVIDERS:
+                    provider_kwargs["json_schema"] = request.json_schema
+                
+                prompt = request.prompt
+                if request.cache_prefix:
+                    if provider_name in PROMPT_CACHE_PROVIDERS:
+                        provider_kwargs["cache_prefix"] = request.cache_prefix
+                    else:
+                        prompt = request.cache_prefix + request.prompt
                 
                 result = await circuit_breaker.call_async(
                     provider.generate,
-                    request.prompt,
+                    prompt,
                     request.temperature,
                     request.json_mode,
                     model=provider_model,
@@ -141,6 +141,15 @@ class AsyncTask(Task):
             except Exception as final_cleanup_error:
                 logger.warning(f"[AsyncTask] Warning during final cleanup: {final_cleanup_error}")
             
+            # The shared PDF browser is bound to this loop; close it (and its Playwright driver)
+            # on success and failure alike, since the next task runs on a new loop and would
+            # otherwise abandon it
+            try:
+                from app.services.artifacts import browser_pool
+                loop.run_until_complete(browser_pool.close_browser())
+            except Exception as browser_cleanup_error:
+                logger.warning(f"[AsyncTask] Warning during browser cleanup: {browser_cleanup_error}")
+            
             logger.info("[AsyncTask] Closing event loop")
             try:
                 loop.close()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Compile the PDF brief templates to Python modules.
+
+Run as an image build step (after copying the application code) so workers import the
+compiled templates instead of parsing them on first use:
+    python -m scripts.compile_templates
+
+Output goes to app/services/artifacts/templates/_compiled, where
+app.services.artifacts.templates picks it up. The modules are only used while they are
+newer than the .html sources, so a stale build falls back to the templates themselves.
+
+Only Jinja is needed: the app package (and its configuration) is not imported, so this
+runs in a plain build environment.
+"""
+
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "app" / "services" / "artifacts" / "templates"
+COMPILED_TEMPLATES_DIR = TEMPLATES_DIR / "_compiled"
+
+
+def main():
+    """Compile all templates and report where they were written."""
+    # Must match template_env's code-affecting options (autoescape) in templates.py
+    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), autoescape=True)
+    env.compile_templates(
+        str(COMPILED_TEMPLATES_DIR), extensions=["html"], zip=None, ignore_errors=False
+    )
+    print(f"Compiled templates written to {COMPILED_TEMPLATES_DIR}")
+
+
+if __name__ == "__main__":
+    main()
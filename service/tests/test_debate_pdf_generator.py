@@ -0,0 +1,39 @@
+from app.services.artifacts import debate_pdf_generator
+
+
+async def test_cache_hit_skips_markdown_conversion(tmp_path, monkeypatch):
+    monkeypatch.setattr(debate_pdf_generator, "PDF_CACHE_DIR", tmp_path)
+    session_json = {"metadata": {"topic": "Cached topic"}}
+    markdown_content = debate_pdf_generator.format_output_markdown(
+        debate_pdf_generator.extract_json_data(session_json)
+    )
+    debate_pdf_generator._write_cached_pdf(
+        debate_pdf_generator._pdf_cache_key(markdown_content), b"%PDF-cached"
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit must not re-render")
+
+    monkeypatch.setattr(debate_pdf_generator, "markdown_to_html", fail)
+    monkeypatch.setattr(debate_pdf_generator, "html_to_pdf_bytes", fail)
+
+    assert await debate_pdf_generator.generate_pdf_from_debate_json(session_json) == b"%PDF-cached"
+
+
+def test_cache_writes_use_unique_temp_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(debate_pdf_generator, "PDF_CACHE_DIR", tmp_path)
+    temp_paths = []
+    real_replace = debate_pdf_generator.os.replace
+
+    def record_replace(src, dst):
+        temp_paths.append(src)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(debate_pdf_generator.os, "replace", record_replace)
+
+    debate_pdf_generator._write_cached_pdf("samekey", b"first")
+    debate_pdf_generator._write_cached_pdf("samekey", b"second")
+
+    assert len(set(temp_paths)) == 2
+    assert (tmp_path / "brief_samekey.pdf").read_bytes() == b"second"
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,102 @@
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from app.services.artifacts.json_export import (
+    _encode_chunk,
+    _event_to_dict,
+    _orjson_default,
+    export_debate_to_json,
+)
+
+pgproto = pytest.importorskip("asyncpg.pgproto.pgproto")
+
+
+def _event(**overrides):
+    fields = {
+        "id": pgproto.UUID(str(uuid.uuid4())),
+        "sequence_id": 1,
+        "phase": "opening",
+        "event_type": "position_card",
+        "schema_version": "1",
+        "payload": {"headline": "h"},
+        "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "knight_id": pgproto.UUID(str(uuid.uuid4())),
+        "prompt_tokens": None,
+        "completion_tokens": None,
+        "cost_cents": None,
+        "latency_ms": None,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_encode_chunk_serializes_asyncpg_uuids():
+    event = _event()
+
+    exported = orjson.loads(b"[" + _encode_chunk([_event_to_dict(event), _event_to_dict(_event(knight_id=None))]) + b"]")
+
+    assert exported[0]["id"] == str(event.id)
+    assert exported[0]["knight_id"] == str(event.knight_id)
+    assert "knight_id" not in exported[1]
+
+
+def test_orjson_default_rejects_other_types():
+    with pytest.raises(TypeError):
+        orjson.dumps({"value": object()}, default=_orjson_default)
+
+
+class _FakeStream:
+    def __init__(self, partitions):
+        self._partitions = partitions
+        self.closed = False
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeDb:
+    def __init__(self, stream):
+        self._stream = stream
+
+    async def stream_scalars(self, stmt):
+        return self._stream
+
+
+def _session():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        session_id="session-1",
+        topic="topic",
+        status="completed",
+        created_at=None,
+        completed_at=None,
+        knights=[],
+    )
+
+
+async def test_export_streams_events_and_closes_result(tmp_path):
+    stream = _FakeStream([[_event(sequence_id=1), _event(sequence_id=2)], [_event(sequence_id=3)]])
+
+    path = await export_debate_to_json("session-1", _session(), _FakeDb(stream), output_dir=tmp_path)
+
+    exported = orjson.loads(Path(path).read_bytes())
+    assert [e["sequence_id"] for e in exported["events"]] == [1, 2, 3]
+    assert stream.closed
+
+
+async def test_export_closes_result_when_encoding_fails(tmp_path):
+    stream = _FakeStream([[_event(payload={"bad": object()})], [_event()]])
+
+    with pytest.raises(TypeError):
+        await export_debate_to_json("session-1", _session(), _FakeDb(stream), output_dir=tmp_path)
+
+    assert stream.closed
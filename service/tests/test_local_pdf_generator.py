@@ -0,0 +1,19 @@
+from app.services.artifacts.local_pdf_generator import _BRIEF_HTML_SHELL, validate_html_structure
+
+
+def test_body_only_brief_relying_on_base_stylesheet_is_valid():
+    body = (
+        '<div class="section"><h2>Executive Summary</h2><p>Summary.</p></div>'
+        '<div class="recommendation-box"><p>Recommendation.</p></div>'
+    )
+
+    result = validate_html_structure(_BRIEF_HTML_SHELL.replace("{{CONTENT}}", body))
+
+    assert result.valid, result.errors
+
+
+def test_missing_structure_is_still_rejected():
+    result = validate_html_structure("<p>Executive summary</p>")
+
+    assert not result.valid
+    assert "Missing DOCTYPE declaration" in result.errors
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+from app.services.artifacts import pdf_generation, s3_upload
+
+
+def _patch_pipeline(monkeypatch, llm_complete):
+    uploads = []
+
+    async def fake_find_existing_pdf_async(session_id, source_sha256):
+        return None
+
+    async def fake_generate(session_id, session_json, **kwargs):
+        return b"%PDF", llm_complete
+
+    async def fake_upload(pdf_bytes, session_id, source_sha256=None):
+        uploads.append(source_sha256)
+        return f"s3://bucket/{session_id}.pdf"
+
+    monkeypatch.setattr(pdf_generation, "read_json_from_s3", lambda uri: b'{"events": []}')
+    monkeypatch.setattr(pdf_generation, "find_existing_pdf_async", fake_find_existing_pdf_async)
+    monkeypatch.setattr(pdf_generation, "generate_pdf_from_session_json", fake_generate)
+    monkeypatch.setattr(pdf_generation, "upload_pdf_bytes_to_s3_async", fake_upload)
+    monkeypatch.setattr(pdf_generation, "_pdf_uri_cache", type(pdf_generation._pdf_uri_cache)())
+    return uploads
+
+
+def _session():
+    return SimpleNamespace(user_id="user-1", audit_log_uri="s3://bucket/session.json")
+
+
+async def test_fallback_pdf_is_not_cached_for_its_transcript(monkeypatch):
+    uploads = _patch_pipeline(monkeypatch, llm_complete=False)
+
+    await pdf_generation.generate_and_upload_pdf("session-1", _session(), db=None)
+    await pdf_generation.generate_and_upload_pdf("session-1", _session(), db=None)
+
+    assert uploads == [None, None]
+    assert not pdf_generation._pdf_uri_cache
+
+
+async def test_complete_pdf_is_cached_for_its_transcript(monkeypatch):
+    uploads = _patch_pipeline(monkeypatch, llm_complete=True)
+
+    first = await pdf_generation.generate_and_upload_pdf("session-1", _session(), db=None)
+    second = await pdf_generation.generate_and_upload_pdf("session-1", _session(), db=None)
+
+    assert first == second
+    assert len(uploads) == 1 and uploads[0] is not None
+
+
+def test_local_hash_is_forgotten_when_pdf_replaced_without_one(tmp_path, monkeypatch):
+    monkeypatch.setattr(s3_upload, "LOCAL_PDF_SOURCE_HASH_DIR", tmp_path)
+    s3_upload._save_local_pdf_source_hash("session-1", "abc")
+    assert any(tmp_path.iterdir())
+
+    s3_upload._save_local_pdf_source_hash("session-1", None)
+
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+from app.services.artifacts import s3_upload
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range not available")
+def test_copy_file_finishes_after_short_copy_file_range(tmp_path, monkeypatch):
+    source = tmp_path / "source.bin"
+    dest = tmp_path / "dest.bin"
+    data = os.urandom(256 * 1024)
+    source.write_bytes(data)
+    real_copy_file_range = os.copy_file_range
+    calls = []
+
+    def short_copy_file_range(src_fd, dst_fd, count, *args):
+        calls.append(count)
+        # Copy one chunk, then report EOF early as a filesystem may
+        return real_copy_file_range(src_fd, dst_fd, 4096) if len(calls) == 1 else 0
+
+    monkeypatch.setattr(s3_upload.os, "copy_file_range", short_copy_file_range)
+
+    s3_upload._copy_file(source, dest)
+
+    assert len(calls) == 2
+    assert dest.read_bytes() == data
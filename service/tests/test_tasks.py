@@ -0,0 +1,27 @@
+import pytest
+
+from app.services.artifacts import browser_pool
+from app.workers.tasks import AsyncTask
+
+
+@pytest.mark.parametrize("fails", [False, True])
+def test_run_async_closes_browser_on_success_and_failure(monkeypatch, fails):
+    closed = []
+
+    async def fake_close_browser():
+        closed.append(True)
+
+    async def job():
+        if fails:
+            raise RuntimeError("boom")
+        return "done"
+
+    monkeypatch.setattr(browser_pool, "close_browser", fake_close_browser)
+
+    if fails:
+        with pytest.raises(RuntimeError):
+            AsyncTask().run_async(job())
+    else:
+        assert AsyncTask().run_async(job()) == "done"
+
+    assert closed == [True]
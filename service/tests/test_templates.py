@@ -0,0 +1,20 @@
+from markupsafe import Markup
+
+from app.services.artifacts import templates
+
+
+def test_decision_brief_renders_on_demand():
+    ctx = templates.DecisionBriefCtx(
+        question="Should we <ship>?",
+        date="2026.1.2",
+        session_id_short="abc123",
+        summary=Markup("<p>Summary</p>"),
+        confidence=80,
+        sources=(templates.Source(url="https://example.com?a=1&b=2", title="Example", snippet=None),),
+    )
+
+    html = templates.render_decision_brief(ctx)
+
+    assert "Should we &lt;ship&gt;?" in html
+    assert "<p>Summary</p>" in html
+    assert 'href="https://example.com?a=1&amp;b=2"' in html